@@ -7,6 +7,13 @@ from PyQt6.QtCore import QObject, pyqtSignal
 import pandas as pd
 from typing import Dict, List, Optional, Any
 
+# Dirty-domain bits, set by data setters and consumed by tab refreshes
+QC_DIRTY = 1 << 0
+RESULTS_DIRTY = 1 << 1
+SUMMARY_DIRTY = 1 << 2
+EXPORT_DIRTY = 1 << 3
+ALL_DIRTY = QC_DIRTY | RESULTS_DIRTY | SUMMARY_DIRTY | EXPORT_DIRTY
+
 
 class AppModel(QObject):
     """
@@ -23,6 +30,7 @@ class AppModel(QObject):
     merge_complete = pyqtSignal()
     core_data_loaded = pyqtSignal()
     formation_tops_loaded = pyqtSignal()
+    model_reset = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -40,6 +48,11 @@ class AppModel(QObject):
         self._core_data = None
         self._merge_report = None
         self._calculated: bool = False
+        self._dirty_flags: int = 0
+        # Session parameters changed since the last clear_dirty_params()
+        self._dirty_params: set = set()
+        # Directory of the last file opened from the sidebar
+        self._last_open_dir: str = ""
 
         # =====================================================================
         # CURVE MAPPING
@@ -185,6 +198,7 @@ class AppModel(QObject):
     @las_data.setter
     def las_data(self, value: Optional[pd.DataFrame]):
         self._las_data = value
+        self._dirty_flags |= QC_DIRTY
         if value is not None:
             self.data_loaded.emit()
 
@@ -195,6 +209,7 @@ class AppModel(QObject):
     @las_parser.setter
     def las_parser(self, value):
         self._las_parser = value
+        self._dirty_flags |= QC_DIRTY
 
     @property
     def las_filename(self) -> str:
@@ -211,6 +226,7 @@ class AppModel(QObject):
     @qc_report.setter
     def qc_report(self, value):
         self._qc_report = value
+        self._dirty_flags |= QC_DIRTY
 
     @property
     def results(self) -> Optional[pd.DataFrame]:
@@ -219,6 +235,7 @@ class AppModel(QObject):
     @results.setter
     def results(self, value: Optional[pd.DataFrame]):
         self._results = value
+        self._dirty_flags |= RESULTS_DIRTY | SUMMARY_DIRTY | EXPORT_DIRTY
         if value is not None:
             self._calculated = True
             self.analysis_complete.emit()
@@ -230,6 +247,7 @@ class AppModel(QObject):
     @summary.setter
     def summary(self, value: Optional[Dict]):
         self._summary = value
+        self._dirty_flags |= SUMMARY_DIRTY
 
     @property
     def formation_tops(self):
@@ -238,6 +256,7 @@ class AppModel(QObject):
     @formation_tops.setter
     def formation_tops(self, value):
         self._formation_tops = value
+        self._dirty_flags |= QC_DIRTY | RESULTS_DIRTY
         if value is not None:
             self.formation_tops_loaded.emit()
 
@@ -248,6 +267,7 @@ class AppModel(QObject):
     @core_data.setter
     def core_data(self, value):
         self._core_data = value
+        self._dirty_flags |= RESULTS_DIRTY
         if value is not None:
             self.core_data_loaded.emit()
 
@@ -258,9 +278,31 @@ class AppModel(QObject):
     @merge_report.setter
     def merge_report(self, value):
         self._merge_report = value
+        self._dirty_flags |= QC_DIRTY
         if value is not None:
             self.merge_complete.emit()
 
+    @property
+    def dirty_flags(self) -> int:
+        """Bitmask of data domains changed since the last clear_dirty_flags()."""
+        return self._dirty_flags
+
+    def clear_dirty_flags(self):
+        self._dirty_flags = 0
+
+    @property
+    def dirty_params(self) -> set:
+        """Names of session parameters changed since the last clear_dirty_params()."""
+        return self._dirty_params
+
+    def clear_dirty_params(self):
+        self._dirty_params = set()
+
+    def _mark_param(self, name: str, value):
+        """Record a session parameter as dirty if value differs from the current one."""
+        if getattr(self, "_" + name) != value:
+            self._dirty_params.add(name)
+
     @property
     def calculated(self) -> bool:
         return self._calculated
@@ -269,6 +311,14 @@ class AppModel(QObject):
     def calculated(self, value: bool):
         self._calculated = value
 
+    @property
+    def last_open_dir(self) -> str:
+        return self._last_open_dir
+
+    @last_open_dir.setter
+    def last_open_dir(self, value: str):
+        self._last_open_dir = value
+
     # =========================================================================
     # PROPERTIES - CURVE MAPPING
     # =========================================================================
@@ -295,6 +345,7 @@ class AppModel(QObject):
 
     @analysis_mode.setter
     def analysis_mode(self, value: str):
+        self._mark_param("analysis_mode", value)
         self._analysis_mode = value
         self.parameters_changed.emit()
 
@@ -304,6 +355,7 @@ class AppModel(QObject):
 
     @selected_formations.setter
     def selected_formations(self, value: List[str]):
+        self._mark_param("selected_formations", value)
         self._selected_formations = value
         self.parameters_changed.emit()
 
@@ -316,6 +368,7 @@ class AppModel(QObject):
 
     @vsh_baseline_method.setter
     def vsh_baseline_method(self, value: str):
+        self._mark_param("vsh_baseline_method", value)
         self._vsh_baseline_method = value
 
     @property
@@ -324,6 +377,7 @@ class AppModel(QObject):
 
     @gr_min_manual.setter
     def gr_min_manual(self, value: float):
+        self._mark_param("gr_min_manual", value)
         self._gr_min_manual = value
 
     @property
@@ -332,6 +386,7 @@ class AppModel(QObject):
 
     @gr_max_manual.setter
     def gr_max_manual(self, value: float):
+        self._mark_param("gr_max_manual", value)
         self._gr_max_manual = value
 
     @property
@@ -340,6 +395,7 @@ class AppModel(QObject):
 
     @vsh_methods.setter
     def vsh_methods(self, value: List[str]):
+        self._mark_param("vsh_methods", value)
         self._vsh_methods = value
 
     # =========================================================================
@@ -351,6 +407,7 @@ class AppModel(QObject):
 
     @rho_matrix.setter
     def rho_matrix(self, value: float):
+        self._mark_param("rho_matrix", value)
         self._rho_matrix = value
 
     @property
@@ -359,6 +416,7 @@ class AppModel(QObject):
 
     @dt_matrix.setter
     def dt_matrix(self, value: float):
+        self._mark_param("dt_matrix", value)
         self._dt_matrix = value
 
     # =========================================================================
@@ -370,6 +428,7 @@ class AppModel(QObject):
 
     @rho_fluid.setter
     def rho_fluid(self, value: float):
+        self._mark_param("rho_fluid", value)
         self._rho_fluid = value
 
     @property
@@ -378,6 +437,7 @@ class AppModel(QObject):
 
     @dt_fluid.setter
     def dt_fluid(self, value: float):
+        self._mark_param("dt_fluid", value)
         self._dt_fluid = value
 
     # =========================================================================
@@ -389,6 +449,7 @@ class AppModel(QObject):
 
     @shale_approach.setter
     def shale_approach(self, value: str):
+        self._mark_param("shale_approach", value)
         self._shale_approach = value
 
     @property
@@ -397,6 +458,7 @@ class AppModel(QObject):
 
     @rho_shale.setter
     def rho_shale(self, value: float):
+        self._mark_param("rho_shale", value)
         self._rho_shale = value
 
     @property
@@ -405,6 +467,7 @@ class AppModel(QObject):
 
     @dt_shale.setter
     def dt_shale(self, value: float):
+        self._mark_param("dt_shale", value)
         self._dt_shale = value
 
     @property
@@ -413,6 +476,7 @@ class AppModel(QObject):
 
     @nphi_shale.setter
     def nphi_shale(self, value: float):
+        self._mark_param("nphi_shale", value)
         self._nphi_shale = value
 
     @property
@@ -523,6 +587,7 @@ class AppModel(QObject):
 
     @lithology_preset.setter
     def lithology_preset(self, value: str):
+        self._mark_param("lithology_preset", value)
         self._lithology_preset = value
 
     @property
@@ -531,6 +596,7 @@ class AppModel(QObject):
 
     @a.setter
     def a(self, value: float):
+        self._mark_param("a", value)
         self._a = value
 
     @property
@@ -539,6 +605,7 @@ class AppModel(QObject):
 
     @m.setter
     def m(self, value: float):
+        self._mark_param("m", value)
         self._m = value
 
     @property
@@ -547,6 +614,7 @@ class AppModel(QObject):
 
     @n.setter
     def n(self, value: float):
+        self._mark_param("n", value)
         self._n = value
 
     # =========================================================================
@@ -558,6 +626,7 @@ class AppModel(QObject):
 
     @rw.setter
     def rw(self, value: float):
+        self._mark_param("rw", value)
         self._rw = value
 
     @property
@@ -566,6 +635,7 @@ class AppModel(QObject):
 
     @rsh.setter
     def rsh(self, value: float):
+        self._mark_param("rsh", value)
         self._rsh = value
 
     @property
@@ -593,6 +663,7 @@ class AppModel(QObject):
 
     @perm_C.setter
     def perm_C(self, value: float):
+        self._mark_param("perm_C", value)
         self._perm_C = value
 
     @property
@@ -601,6 +672,7 @@ class AppModel(QObject):
 
     @perm_P.setter
     def perm_P(self, value: float):
+        self._mark_param("perm_P", value)
         self._perm_P = value
 
     @property
@@ -609,6 +681,7 @@ class AppModel(QObject):
 
     @perm_Q.setter
     def perm_Q(self, value: float):
+        self._mark_param("perm_Q", value)
         self._perm_Q = value
 
     @property
@@ -644,6 +717,7 @@ class AppModel(QObject):
 
     @swirr_method.setter
     def swirr_method(self, value: str):
+        self._mark_param("swirr_method", value)
         self._swirr_method = value
 
     @property
@@ -652,6 +726,7 @@ class AppModel(QObject):
 
     @buckles_preset.setter
     def buckles_preset(self, value: str):
+        self._mark_param("buckles_preset", value)
         self._buckles_preset = value
 
     @property
@@ -660,6 +735,7 @@ class AppModel(QObject):
 
     @k_buckles.setter
     def k_buckles(self, value: float):
+        self._mark_param("k_buckles", value)
         self._k_buckles = value
 
     # =========================================================================
@@ -671,6 +747,7 @@ class AppModel(QObject):
 
     @vsh_cutoff.setter
     def vsh_cutoff(self, value: float):
+        self._mark_param("vsh_cutoff", value)
         self._vsh_cutoff = value
 
     @property
@@ -679,6 +756,7 @@ class AppModel(QObject):
 
     @phi_cutoff.setter
     def phi_cutoff(self, value: float):
+        self._mark_param("phi_cutoff", value)
         self._phi_cutoff = value
 
     @property
@@ -687,6 +765,7 @@ class AppModel(QObject):
 
     @sw_cutoff.setter
     def sw_cutoff(self, value: float):
+        self._mark_param("sw_cutoff", value)
         self._sw_cutoff = value
 
     # =========================================================================
@@ -698,6 +777,7 @@ class AppModel(QObject):
 
     @sw_methods.setter
     def sw_methods(self, value: List[str]):
+        self._mark_param("sw_methods", value)
         self._sw_methods = value
 
     @property
@@ -706,6 +786,7 @@ class AppModel(QObject):
 
     @sw_primary_method.setter
     def sw_primary_method(self, value: str):
+        self._mark_param("sw_primary_method", value)
         self._sw_primary_method = value
 
     @property
@@ -714,6 +795,7 @@ class AppModel(QObject):
 
     @ws_qv.setter
     def ws_qv(self, value: float):
+        self._mark_param("ws_qv", value)
         self._ws_qv = value
 
     @property
@@ -722,6 +804,7 @@ class AppModel(QObject):
 
     @ws_b.setter
     def ws_b(self, value: float):
+        self._mark_param("ws_b", value)
         self._ws_b = value
 
     @property
@@ -730,6 +813,7 @@ class AppModel(QObject):
 
     @dw_swb.setter
     def dw_swb(self, value: float):
+        self._mark_param("dw_swb", value)
         self._dw_swb = value
 
     @property
@@ -738,6 +822,7 @@ class AppModel(QObject):
 
     @dw_rwb.setter
     def dw_rwb(self, value: float):
+        self._mark_param("dw_rwb", value)
         self._dw_rwb = value
 
     # =========================================================================
@@ -749,6 +834,7 @@ class AppModel(QObject):
 
     @merge_step.setter
     def merge_step(self, value: float):
+        self._mark_param("merge_step", value)
         self._merge_step = value
 
     @property
@@ -757,6 +843,7 @@ class AppModel(QObject):
 
     @merge_gap_limit.setter
     def merge_gap_limit(self, value: float):
+        self._mark_param("merge_gap_limit", value)
         self._merge_gap_limit = value
 
     # =========================================================================
@@ -768,6 +855,7 @@ class AppModel(QObject):
 
     @core_depth_unit.setter
     def core_depth_unit(self, value: str):
+        self._mark_param("core_depth_unit", value)
         self._core_depth_unit = value
 
     @property
@@ -776,6 +864,7 @@ class AppModel(QObject):
 
     @core_max_dist.setter
     def core_max_dist(self, value: float):
+        self._mark_param("core_max_dist", value)
         self._core_max_dist = value
 
     # =========================================================================
@@ -787,6 +876,7 @@ class AppModel(QObject):
 
     @gas_correction_enabled.setter
     def gas_correction_enabled(self, value: bool):
+        self._mark_param("gas_correction_enabled", value)
         self._gas_correction_enabled = value
 
     @property
@@ -795,6 +885,7 @@ class AppModel(QObject):
 
     @gas_nphi_factor.setter
     def gas_nphi_factor(self, value: float):
+        self._mark_param("gas_nphi_factor", value)
         self._gas_nphi_factor = value
 
     @property
@@ -803,11 +894,86 @@ class AppModel(QObject):
 
     @gas_rhob_factor.setter
     def gas_rhob_factor(self, value: float):
+        self._mark_param("gas_rhob_factor", value)
         self._gas_rhob_factor = value
 
     # =========================================================================
     # METHODS
     # =========================================================================
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the session parameters as a flat dict of plain values."""
+        return {
+            # Analysis mode
+            "analysis_mode": self.analysis_mode,
+            "selected_formations": self.selected_formations,
+
+            # VShale parameters
+            "vsh_baseline_method": self.vsh_baseline_method,
+            "gr_min_manual": self.gr_min_manual,
+            "gr_max_manual": self.gr_max_manual,
+            "vsh_methods": self.vsh_methods,
+
+            # Matrix parameters
+            "rho_matrix": self.rho_matrix,
+            "dt_matrix": self.dt_matrix,
+
+            # Fluid parameters
+            "rho_fluid": self.rho_fluid,
+            "dt_fluid": self.dt_fluid,
+
+            # Shale parameters
+            "shale_approach": self.shale_approach,
+            "rho_shale": self.rho_shale,
+            "dt_shale": self.dt_shale,
+            "nphi_shale": self.nphi_shale,
+
+            # Archie parameters
+            "lithology_preset": self.lithology_preset,
+            "a": self.a,
+            "m": self.m,
+            "n": self.n,
+
+            # Resistivity parameters
+            "rw": self.rw,
+            "rsh": self.rsh,
+
+            # Permeability parameters
+            "perm_C": self.perm_C,
+            "perm_P": self.perm_P,
+            "perm_Q": self.perm_Q,
+
+            # Swirr parameters
+            "swirr_method": self.swirr_method,
+            "buckles_preset": self.buckles_preset,
+            "k_buckles": self.k_buckles,
+
+            # Cutoff parameters
+            "vsh_cutoff": self.vsh_cutoff,
+            "phi_cutoff": self.phi_cutoff,
+            "sw_cutoff": self.sw_cutoff,
+
+            # Sw Parameters
+            "sw_methods": self.sw_methods,
+            "sw_primary_method": self.sw_primary_method,
+            "ws_qv": self.ws_qv,
+            "ws_b": self.ws_b,
+            "dw_swb": self.dw_swb,
+            "dw_rwb": self.dw_rwb,
+
+            # Merge settings
+            "merge_step": self.merge_step,
+            "merge_gap_limit": self.merge_gap_limit,
+
+            # Core settings
+            "core_depth_unit": self.core_depth_unit,
+            "core_max_dist": self.core_max_dist,
+
+            # Gas correction (v1.2)
+            "gas_correction_enabled": self.gas_correction_enabled,
+            "gas_nphi_factor": self.gas_nphi_factor,
+            "gas_rhob_factor": self.gas_rhob_factor,
+        }
+
     def reset(self):
         """Reset all data (keep parameters)."""
         self._las_data = None
@@ -820,6 +986,7 @@ class AppModel(QObject):
         self._core_data = None
         self._merge_report = None
         self._calculated = False
+        self._dirty_flags = ALL_DIRTY
         self._curve_mapping = {
             "GR": "None",
             "RHOB": "None",
@@ -827,6 +994,7 @@ class AppModel(QObject):
             "DT": "None",
             "RT": "None",
         }
+        self.model_reset.emit()
 
     def get_available_curves(self) -> List[str]:
         """Get list of available curves from loaded LAS data."""
@@ -8,6 +8,20 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 
+# Encodings tried, in order, for binary LAS content; older field data is
+# often cp1252. Anything else falls back to latin-1, which maps every byte.
+LAS_ENCODINGS = ('utf-8-sig', 'cp1252')
+
+
+def decode_las_bytes(raw: bytes) -> str:
+    """Decode LAS file bytes without replacing any characters."""
+    for encoding in LAS_ENCODINGS:
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            pass
+    return raw.decode('latin-1')
+
 
 class LASParser:
     """
@@ -46,7 +60,8 @@ class LASParser:
         Read a LAS file from a file buffer (for Streamlit uploads).
         
         Args:
-            file_buffer: File buffer object
+            file_buffer: File buffer object (text or binary; binary content
+                is decoded once as a whole, see decode_las_bytes)
             
         Returns:
             True if successful, False otherwise
@@ -60,7 +75,7 @@ class LASParser:
             
             # Handle both bytes and string content
             if isinstance(content, bytes):
-                content = content.decode('utf-8', errors='replace')
+                content = decode_las_bytes(content)
             
             # Create StringIO object for lasio
             string_io = io.StringIO(content)
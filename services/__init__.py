@@ -3,5 +3,7 @@ from .analysis_service import AnalysisService
 from .merge_service import MergeService
 from .export_service import ExportService
 from .session_service import SessionService
+from .las_load_service import LasLoadService
+from .qc_service import QcService
 
-__all__ = ['AnalysisService', 'MergeService', 'ExportService', 'SessionService']
+__all__ = ['AnalysisService', 'MergeService', 'ExportService', 'SessionService', 'LasLoadService', 'QcService']
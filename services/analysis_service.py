@@ -6,6 +6,7 @@ Wraps the petrophysics calculation logic for background execution.
 from PyQt6.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
 import pandas as pd
 import numpy as np
+from types import SimpleNamespace
 from typing import Dict, Tuple, Optional
 import traceback
 
@@ -17,6 +18,81 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from modules.petrophysics import PetrophysicsCalculator
 from modules.statistics_utils import StatisticsUtils
 
+# AppModel attributes read by the parameter estimations
+_ESTIMATION_INPUTS = (
+    # Data
+    "las_data",
+    "formation_tops",
+    "core_data",
+    "results",
+    # Interval and curve selection
+    "analysis_mode",
+    "selected_formations",
+    "curve_mapping",
+    # VShale and shale point selection
+    "vsh_baseline_method",
+    "gr_min_manual",
+    "gr_max_manual",
+    "vsh_methods",
+    "shale_vsh_threshold",
+    "shale_gate_logs",
+    "shale_iqr_filter",
+    "shale_selection_mode",
+    "shale_vsh_quantile",
+    "shale_min_points",
+    "shale_sweep_tmin",
+    "shale_sweep_tmax",
+    "shale_sweep_step",
+    # Archie, Swirr and permeability
+    "a",
+    "m",
+    "k_buckles",
+    "perm_Q",
+)
+
+
+def _bounded_lstsq_2d(A: np.ndarray, b: np.ndarray, lower, upper) -> np.ndarray:
+    """
+    Least squares for two unknowns within box bounds.
+
+    The unconstrained solution is used when it lies inside the box;
+    otherwise the minimum lies on an edge, where holding one unknown at
+    its bound leaves a one-dimensional problem that clipping solves
+    exactly.
+    """
+    x, *_ = np.linalg.lstsq(A, b, rcond=None)
+    if np.all((lower <= x) & (x <= upper)):
+        return x
+
+    candidates = []
+    for fixed in (0, 1):
+        free = 1 - fixed
+        col = A[:, free]
+        for bound in (lower[fixed], upper[fixed]):
+            rest = b - bound * A[:, fixed]
+            value = np.clip(col @ rest / (col @ col), lower[free], upper[free])
+            candidate = np.empty(2)
+            candidate[fixed] = bound
+            candidate[free] = value
+            candidates.append(candidate)
+    return min(candidates, key=lambda c: np.sum((A @ c - b) ** 2))
+
+
+def _snapshot_inputs(model) -> SimpleNamespace:
+    """
+    Copy the estimation inputs off the model.
+
+    Lists and dicts are copied; data frames are shared, since the model
+    replaces them instead of modifying them in place.
+    """
+    values = {}
+    for name in _ESTIMATION_INPUTS:
+        value = getattr(model, name)
+        if isinstance(value, (list, dict)):
+            value = value.copy()
+        values[name] = value
+    return SimpleNamespace(**values)
+
 
 class AnalysisSignals(QObject):
     """Signals for analysis worker."""
@@ -369,6 +445,39 @@ class AnalysisWorker(QRunnable):
             )
 
 
+class EstimationSignals(QObject):
+    """Signals for estimation worker."""
+
+    finished = pyqtSignal(str, object)  # (kind, result)
+    error = pyqtSignal(str, str)  # (kind, message)
+
+
+class EstimationWorker(QRunnable):
+    """
+    Worker for running one sidebar parameter estimation (shale, Rw/Rsh,
+    permeability coefficients) in background thread.
+
+    model is a snapshot of the estimation inputs, not the live AppModel.
+    """
+
+    def __init__(self, kind: str, func, model):
+        super().__init__()
+        self.kind = kind
+        self.func = func
+        self.model = model
+        self.signals = EstimationSignals()
+
+    def run(self):
+        """Execute the estimation."""
+        try:
+            result = self.func(self.model)
+        except Exception as e:
+            self.signals.error.emit(self.kind, str(e))
+            traceback.print_exc()
+        else:
+            self.signals.finished.emit(self.kind, result)
+
+
 class AnalysisService(QObject):
     """
     Service for running petrophysics analysis.
@@ -380,10 +489,17 @@ class AnalysisService(QObject):
     completed = pyqtSignal(pd.DataFrame, dict)
     error = pyqtSignal(str)
 
+    # Parameter estimations: kind is "rw_rsh", "shale" or "perm"
+    estimation_started = pyqtSignal(str)  # kind
+    estimated = pyqtSignal(str, object)  # (kind, result or None)
+    estimation_error = pyqtSignal(str, str)  # (kind, message)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.thread_pool = QThreadPool()
         self._current_worker = None
+        # Latest request per estimation kind; older results are dropped
+        self._estimation_generation = {}
 
     def run_analysis(self, model):
         """Start analysis in background thread."""
@@ -404,6 +520,45 @@ class AnalysisService(QObject):
         self.completed.emit(results, summary)
         # print(f"[DEBUG AnalysisService] Signal emitted")
 
+    def estimate_async(self, kind: str, model):
+        """
+        Start a parameter estimation in background thread.
+
+        The result (None if the data does not allow an estimate) is
+        delivered through estimated, exceptions through estimation_error.
+        """
+        func = {
+            "rw_rsh": self.calculate_rw_rsh,
+            "shale": self.calculate_shale_parameters,
+            "perm": self.estimate_perm_coefficients,
+        }[kind]
+        generation = self._estimation_generation.get(kind, 0) + 1
+        self._estimation_generation[kind] = generation
+
+        # Snapshot on the calling (UI) thread, so the worker never reads the
+        # live model while parameters are being written back to it
+        worker = EstimationWorker(kind, func, _snapshot_inputs(model))
+        worker.signals.finished.connect(
+            lambda kind, result: self._on_estimated(generation, kind, result)
+        )
+        worker.signals.error.connect(
+            lambda kind, message: self._on_estimation_error(
+                generation, kind, message
+            )
+        )
+        self.estimation_started.emit(kind)
+        self.thread_pool.start(worker)
+
+    def _on_estimated(self, generation: int, kind: str, result):
+        """Relay an estimate unless a newer request of its kind superseded it."""
+        if generation == self._estimation_generation.get(kind):
+            self.estimated.emit(kind, result)
+
+    def _on_estimation_error(self, generation: int, kind: str, message: str):
+        """Relay an estimation error unless a newer request superseded it."""
+        if generation == self._estimation_generation.get(kind):
+            self.estimation_error.emit(kind, message)
+
     def calculate_rw_rsh(self, model) -> Optional[Dict]:
         """Calculate Rw and Rsh from log data (synchronous)."""
         if model.las_data is None:
@@ -617,6 +772,107 @@ class AnalysisService(QObject):
             result["error"] = str(e)
             return result
 
+    def estimate_perm_coefficients(self, model) -> Optional[Dict]:
+        """
+        Estimate Wyllie-Rose permeability coefficients (synchronous).
+
+        Fits C and P to core data, keeping the model's current Q, when
+        enough core samples match log depths; otherwise picks all three
+        from the mean effective porosity.
+        Returns None if there are too few porosity values.
+        """
+        core = model.core_data
+        if core is not None:
+            try:
+                fitted = self._fit_perm_to_core(core, model.k_buckles, model.perm_Q)
+            except Exception:
+                fitted = None  # Fall through to statistical estimation
+            if fitted is not None:
+                C, P, Q = fitted
+                return {
+                    "C": C,
+                    "P": P,
+                    "Q": Q,
+                    "message": f"Core-calibrated: C={C:.0f}, P={P:.2f}, Q={Q:.2f}",
+                }
+
+        # Statistical estimation based on porosity (works without core)
+        phie = model.results["PHIE"].dropna()
+        if len(phie) < 10:
+            return None
+
+        phi_mean = phie.mean()
+
+        # Adjust coefficients based on porosity distribution
+        if phi_mean > 0.20:
+            # High porosity - unconsolidated
+            C, P, Q = 10000.0, 4.0, 2.0
+        elif phi_mean > 0.12:
+            # Medium porosity - typical sandstone (Timur defaults)
+            C, P, Q = 8581.0, 4.4, 2.0
+        else:
+            # Low porosity - tight formation
+            C, P, Q = 5000.0, 5.0, 2.2
+
+        return {
+            "C": C,
+            "P": P,
+            "Q": Q,
+            "message": (
+                f"Estimated from porosity (mean={phi_mean:.3f}): "
+                f"C={C:.0f}, P={P:.2f}, Q={Q:.2f}"
+            ),
+        }
+
+    def _fit_perm_to_core(self, core, k_buckles: float, Q: float) -> Optional[Tuple]:
+        """
+        Fit C and P to core permeability for a given Q.
+
+        Returns (C, P, Q), or None if too few samples match.
+        """
+        core_depths, core_perm = core.get_core_permeability()
+        core_depths_por, core_por = core.get_core_porosity()
+
+        if len(core_perm) < 5 or len(core_por) < 5:
+            return None
+
+        # Match porosity with permeability at same depths:
+        # nearest porosity sample via binary search on sorted depths
+        order = np.argsort(core_depths_por, kind="stable")
+        sorted_por_depths = core_depths_por[order]
+        sorted_por_vals = core_por[order]
+        idx = np.clip(
+            np.searchsorted(sorted_por_depths, core_depths),
+            1,
+            len(sorted_por_depths) - 1,
+        )
+        left = sorted_por_depths[idx - 1]
+        right = sorted_por_depths[idx]
+        choose_left = np.abs(core_depths - left) <= np.abs(core_depths - right)
+        nearest_idx = np.where(choose_left, idx - 1, idx)
+        nearest_depth = sorted_por_depths[nearest_idx]
+        mask = np.abs(nearest_depth - core_depths) < 0.5  # Within 0.5 ft
+        matched_por = sorted_por_vals[nearest_idx][mask]
+        matched_perm = core_perm[mask]
+
+        if len(matched_por) < 5:
+            return None
+
+        # Estimate Swirr using Buckles
+        swirr = np.clip(k_buckles / matched_por, 0.05, 0.8)
+
+        # Fit Wyllie-Rose: K = C * phi^P / Swi^Q, which is linear in log space:
+        # log10(K) = log10(C) + P*log10(phi) - Q*log10(Swi)
+        # Swi is itself derived from phi, so C, P and Q cannot all be told
+        # apart by the data; Q is held at the given value and the bounded
+        # fit solves for log10(C) and P only
+        A = np.column_stack([np.ones_like(matched_por), np.log10(matched_por)])
+        b = np.log10(matched_perm + 0.001) + Q * np.log10(swirr)
+        log_c, P = _bounded_lstsq_2d(
+            A, b, np.array([1.0, 2.0]), np.array([np.log10(50000), 8.0])
+        )
+        return float(10**log_c), float(P), float(Q)
+
     def _fallback_result(self, reason: str) -> Dict:
         """Return default fallback result."""
         return {
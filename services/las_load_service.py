@@ -0,0 +1,218 @@
+"""
+LAS Load Service for Petrophyter PyQt
+Reads and parses LAS files in a background thread.
+"""
+
+from PyQt6.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+import traceback
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.las_parser import LASParser
+
+# Upper bound on merge inputs parsed concurrently
+MAX_PARALLEL_FILES = 8
+
+# Upper bound on concurrent stat calls; on network shares the latency of
+# each call overlaps with the others
+MAX_STAT_THREADS = 16
+
+
+@dataclass(frozen=True, slots=True)
+class LasFileEntry:
+    """A selected LAS file with its metadata, read once in the background."""
+
+    path: str
+    basename: str
+    size: Optional[int] = None  # bytes; None if the file could not be stat'ed
+    mtime: Optional[float] = None
+
+    @classmethod
+    def from_stat(cls, path: str, st=None) -> "LasFileEntry":
+        """Build an entry from an os.stat result, stat'ing the path if not given."""
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return cls(path, os.path.basename(path))
+        return cls(path, os.path.basename(path), st.st_size, st.st_mtime)
+
+
+class LasLoadSignals(QObject):
+    """Signals for LAS load worker."""
+
+    finished = pyqtSignal(object, object)  # (parser, LasFileEntry)
+    error = pyqtSignal(str, str)  # (file_path, message)
+    metadata = pyqtSignal(list)  # [LasFileEntry]
+
+
+class LasStatWorker(QRunnable):
+    """Worker for reading the sizes of selected LAS files in background thread."""
+
+    def __init__(self, file_paths: List[str]):
+        super().__init__()
+        self.file_paths = file_paths
+        self.signals = LasLoadSignals()
+
+    def run(self):
+        """Stat all files concurrently."""
+        workers = min(len(self.file_paths), MAX_STAT_THREADS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            entries = list(executor.map(LasFileEntry.from_stat, self.file_paths))
+        self.signals.metadata.emit(entries)
+
+
+class LasLoadWorker(QRunnable):
+    """Worker for parsing a single LAS file in background thread."""
+
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = LasLoadSignals()
+
+    def run(self):
+        """Read and parse the file."""
+        try:
+            parser = LASParser()
+            # Binary read; the parser decodes the whole buffer in one pass
+            with open(self.file_path, "rb") as f:
+                entry = LasFileEntry.from_stat(self.file_path, os.fstat(f.fileno()))
+                success = parser.read_las_from_buffer(f)
+
+            if success and parser.data is not None:
+                self.signals.finished.emit(parser, entry)
+            else:
+                self.signals.error.emit(self.file_path, "Failed to load LAS file")
+
+        except Exception as e:
+            self.signals.error.emit(
+                self.file_path, f"Failed to load LAS file:\n{str(e)}"
+            )
+            traceback.print_exc()
+
+
+class LasLoadService(QObject):
+    """
+    Service for loading LAS files.
+    Manages background thread execution; results are delivered on the
+    thread that owns the service (the UI thread).
+    """
+
+    file_loaded = pyqtSignal(object, object)  # (parser, LasFileEntry)
+    files_loaded = pyqtSignal(list, list)  # (parsers, LasFileEntry list) in order
+    error = pyqtSignal(str, str)  # (file_path, message)
+    metadata_ready = pyqtSignal(list)  # [LasFileEntry] of a batch
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.thread_pool = QThreadPool()
+        self._default_max_threads = self.thread_pool.maxThreadCount()
+        # Bumped on every request so results of superseded loads are dropped
+        self._generation = 0
+        self._pending = 0
+        # (parser, LasFileEntry) per input, or None if the file failed
+        self._batch_results = []
+
+    def load_file(self, file_path: str):
+        """Start loading a single LAS file in background thread."""
+        self._generation += 1
+        generation = self._generation
+
+        worker = LasLoadWorker(file_path)
+        worker.signals.finished.connect(
+            lambda parser, entry: self._on_file_finished(generation, parser, entry)
+        )
+        worker.signals.error.connect(
+            lambda path, message: self._on_error(generation, path, message)
+        )
+        self.thread_pool.start(worker)
+
+    def load_files(self, file_paths: List[str]):
+        """
+        Start loading several LAS files concurrently.
+
+        metadata_ready is emitted with the file entries as soon as they are
+        stat'ed, usually well before parsing ends. files_loaded is emitted
+        once every file has been attempted; files that fail to parse are
+        left out of the result.
+        """
+        self._generation += 1
+        generation = self._generation
+        self._pending = len(file_paths)
+        self._batch_results = [None] * len(file_paths)
+
+        if not file_paths:
+            self.files_loaded.emit([], [])
+            return
+
+        # Reads overlap with parsing, so allow up to MAX_PARALLEL_FILES files
+        # in flight even on machines with fewer cores
+        self.thread_pool.setMaxThreadCount(
+            max(self._default_max_threads, min(len(file_paths), MAX_PARALLEL_FILES))
+        )
+
+        stat_worker = LasStatWorker(list(file_paths))
+        stat_worker.signals.metadata.connect(
+            lambda entries: self._on_metadata(generation, entries)
+        )
+        self.thread_pool.start(stat_worker)
+
+        for index, path in enumerate(file_paths):
+            worker = LasLoadWorker(path)
+            worker.signals.finished.connect(
+                lambda parser, entry, index=index: self._on_batch_item(
+                    generation, index, (parser, entry)
+                )
+            )
+            worker.signals.error.connect(
+                lambda path, message, index=index: self._on_batch_item(
+                    generation, index, None
+                )
+            )
+            self.thread_pool.start(worker)
+
+    def cancel(self):
+        """Drop the results of every load still in progress."""
+        self._generation += 1
+        self._pending = 0
+        self._batch_results = []
+
+    def _on_file_finished(self, generation: int, parser, entry: LasFileEntry):
+        """Relay a single-file result unless a newer load superseded it."""
+        if generation == self._generation:
+            self.file_loaded.emit(parser, entry)
+
+    def _on_error(self, generation: int, file_path: str, message: str):
+        """Relay a single-file error unless a newer load superseded it."""
+        if generation == self._generation:
+            self.error.emit(file_path, message)
+
+    def _on_metadata(self, generation: int, entries: list):
+        """Relay batch file entries while their batch is still being parsed."""
+        if generation == self._generation and self._pending:
+            self.metadata_ready.emit(entries)
+
+    def _on_batch_item(self, generation: int, index: int, result):
+        """Collect one batch result and emit once the batch is complete."""
+        if generation != self._generation:
+            return
+
+        self._batch_results[index] = result
+        self._pending -= 1
+        if self._pending:
+            return
+
+        parsers = []
+        entries = []
+        for result in self._batch_results:
+            if result is not None:
+                parsers.append(result[0])
+                entries.append(result[1])
+        self._batch_results = []
+        self.files_loaded.emit(parsers, entries)
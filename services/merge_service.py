@@ -19,7 +19,7 @@ class MergeSignals(QObject):
     """Signals for merge worker."""
     started = pyqtSignal()
     progress = pyqtSignal(str, int)
-    completed = pyqtSignal(pd.DataFrame, object)  # (merged_df, merge_report)
+    completed = pyqtSignal(pd.DataFrame, object, list)  # (merged_df, merge_report, parsers)
     error = pyqtSignal(str)
 
 
@@ -63,7 +63,7 @@ class MergeWorker(QRunnable):
             merge_report = result['merge_report']
             
             self.signals.progress.emit("Merge complete!", 100)
-            self.signals.completed.emit(merged_df, merge_report)
+            self.signals.completed.emit(merged_df, merge_report, self.parsers)
             
         except Exception as e:
             self.signals.error.emit(f"Merge failed: {str(e)}\n{traceback.format_exc()}")
@@ -72,24 +72,44 @@ class MergeWorker(QRunnable):
 class MergeService(QObject):
     """
     Service for merging multiple LAS files.
-    Manages background thread execution.
+    Manages background thread execution; only the signals of the most
+    recent merge are delivered.
     """
     
     started = pyqtSignal()
     progress = pyqtSignal(str, int)
-    completed = pyqtSignal(pd.DataFrame, object)
+    completed = pyqtSignal(pd.DataFrame, object, list)  # (merged_df, merge_report, parsers)
     error = pyqtSignal(str)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.thread_pool = QThreadPool()
+        # Bumped on every request so signals of superseded merges are dropped
+        self._generation = 0
     
     def merge_files(self, parsers: List, file_names: List[str], step_ft: float, gap_limit_ft: float):
         """Start merge in background thread."""
+        self._generation += 1
+        generation = self._generation
+
         worker = MergeWorker(parsers, file_names, step_ft, gap_limit_ft)
-        worker.signals.started.connect(self.started.emit)
-        worker.signals.progress.connect(self.progress.emit)
-        worker.signals.completed.connect(self.completed.emit)
-        worker.signals.error.connect(self.error.emit)
+        for source, target in (
+            (worker.signals.started, self.started),
+            (worker.signals.progress, self.progress),
+            (worker.signals.completed, self.completed),
+            (worker.signals.error, self.error),
+        ):
+            source.connect(
+                lambda *args, target=target: self._relay(generation, target, args)
+            )
         
         self.thread_pool.start(worker)
+    
+    def cancel(self):
+        """Drop the signals of a merge still in progress."""
+        self._generation += 1
+    
+    def _relay(self, generation: int, signal, args: tuple):
+        """Relay a worker signal unless a newer merge superseded it."""
+        if generation == self._generation:
+            signal.emit(*args)
@@ -0,0 +1,80 @@
+"""
+QC Service for Petrophyter PyQt
+Runs data quality checks in a background thread.
+"""
+
+from PyQt6.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
+import pandas as pd
+import traceback
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.qc_module import QCModule
+
+
+class QcSignals(QObject):
+    """Signals for QC worker."""
+
+    completed = pyqtSignal(object)  # DataQCReport
+    error = pyqtSignal(str)
+
+
+class QcWorker(QRunnable):
+    """Worker for running QC on log data in background thread."""
+
+    def __init__(self, data: pd.DataFrame, well_name: str):
+        super().__init__()
+        self.data = data
+        self.well_name = well_name
+        self.signals = QcSignals()
+
+    def run(self):
+        """Execute the QC checks."""
+        try:
+            qc = QCModule(self.data, self.well_name)
+            self.signals.completed.emit(qc.run_qc())
+        except Exception as e:
+            self.signals.error.emit(f"QC failed: {str(e)}\n{traceback.format_exc()}")
+
+
+class QcService(QObject):
+    """
+    Service for running data QC.
+    Manages background thread execution; only the result of the most
+    recent request is delivered.
+    """
+
+    completed = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.thread_pool = QThreadPool()
+        self._generation = 0
+
+    def run_qc(self, data: pd.DataFrame, well_name: str = "Unknown"):
+        """Start QC in background thread."""
+        self._generation += 1
+        generation = self._generation
+
+        worker = QcWorker(data, well_name)
+        worker.signals.completed.connect(
+            lambda report: self._on_completed(generation, report)
+        )
+        worker.signals.error.connect(
+            lambda message: self._on_error(generation, message)
+        )
+        self.thread_pool.start(worker)
+
+    def _on_completed(self, generation: int, report):
+        """Relay the report unless a newer QC run superseded it."""
+        if generation == self._generation:
+            self.completed.emit(report)
+
+    def _on_error(self, generation: int, message: str):
+        """Relay the error unless a newer QC run superseded it."""
+        if generation == self._generation:
+            self.error.emit(message)
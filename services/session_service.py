@@ -3,22 +3,310 @@ Session Service for Petrophyter PyQt
 Manages saving and loading of analysis sessions.
 """
 
+import hashlib
 import json
+import mmap
 import os
-from typing import Dict, Any, Optional
-from PyQt6.QtCore import QObject, pyqtSignal
+import traceback
+from typing import Callable, Dict, Any, Optional, Tuple
+from PyQt6.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except ImportError:
+    msgpack = None
+    HAS_MSGPACK = False
+
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    zstandard = None
+    HAS_ZSTD = False
+
+try:
+    import xxhash
+
+    HAS_XXHASH = True
+except ImportError:
+    xxhash = None
+    HAS_XXHASH = False
+
+try:
+    import ijson
+
+    HAS_IJSON = True
+except ImportError:
+    ijson = None
+    HAS_IJSON = False
+
+# Extension for MessagePack session files; .json sessions are still read
+SESSION_EXTENSION = '.psess'
+
+# Suffix for zstd-compressed sessions (e.g. session.psess.zst)
+COMPRESSED_SUFFIX = '.zst'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZSTD_LEVEL = 3
+
+# Session files at least this large are memory-mapped on load
+MMAP_THRESHOLD = 1024 * 1024
+
+# JSON session files at least this large are parsed incrementally (ijson)
+STREAM_THRESHOLD = 8 * 1024 * 1024
+
+# Keys read between progress reports while streaming
+STREAM_PROGRESS_INTERVAL = 1000
+
+
+def _to_builtin(obj):
+    """
+    Convert numpy scalars and arrays to plain Python values.
+    
+    Parameters computed from log data (e.g. Rw/Rsh, shale points) can be
+    numpy values; this is the fallback for serializers without native
+    numpy support.
+    """
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Type is not serializable: {type(obj).__name__}")
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize session data to UTF-8 JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        # numpy arrays and scalars are written natively from their buffers
+        return orjson.dumps(
+            data,
+            default=_to_builtin,
+            option=(
+                orjson.OPT_INDENT_2
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_NON_STR_KEYS
+            ),
+        )
+    return json.dumps(
+        data, indent=2, ensure_ascii=False, default=_to_builtin
+    ).encode('utf-8')
+
+
+def _loads(raw) -> Dict[str, Any]:
+    """Parse UTF-8 JSON bytes back into session data."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+
+def _encode(data: Dict[str, Any], file_path: str) -> bytes:
+    """
+    Serialize session data in the format implied by the file extension.
+    
+    A trailing .zst compresses the payload with zstd, which requires the
+    zstandard package.
+    """
+    path = file_path.lower()
+    compress = path.endswith(COMPRESSED_SUFFIX)
+    if compress:
+        if not HAS_ZSTD:
+            raise ValueError("Saving a compressed session requires the zstandard package")
+        path = path[:-len(COMPRESSED_SUFFIX)]
+    
+    if HAS_MSGPACK and path.endswith(SESSION_EXTENSION):
+        payload = msgpack.packb(data, use_bin_type=True, default=_to_builtin)
+    else:
+        payload = _dumps(data)
+    
+    if compress:
+        payload = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+    return payload
+
+
+def _is_json(head) -> bool:
+    """A JSON session is an object, so its first non-blank byte is '{'."""
+    return bytes(head[:64]).lstrip()[:1] == b'{'
+
+
+def _decode(raw) -> Dict[str, Any]:
+    """
+    Parse session bytes, detecting JSON or MessagePack from the content.
+    
+    zstd-compressed data is unpacked first. Anything that does not look
+    like JSON is treated as MessagePack.
+    """
+    if bytes(raw[:4]) == ZSTD_MAGIC:
+        if not HAS_ZSTD:
+            raise ValueError("Reading this session file requires the zstandard package")
+        raw = zstandard.ZstdDecompressor().decompress(raw)
+    
+    if _is_json(raw):
+        return _loads(raw)
+    if not HAS_MSGPACK:
+        raise ValueError("Reading this session file requires the msgpack package")
+    return msgpack.unpackb(raw, raw=False)
+
+
+def _payload_digest(payload: bytes) -> int:
+    """64-bit fingerprint of a serialized session (xxh3 when available)."""
+    if HAS_XXHASH:
+        return xxhash.xxh3_64_intdigest(payload)
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), 'little')
+
+
+def _write_session_file(
+    session_data: Dict[str, Any],
+    file_path: str,
+    previous: Optional[Tuple[int, int]] = None,
+) -> Tuple[int, int]:
+    """
+    Serialize session data and write it to disk.
+    
+    The payload goes to a temporary file that is then renamed over the
+    target, so an interrupted save never leaves a truncated session.
+    
+    Returns the (payload digest, file mtime) fingerprint of the saved
+    file. When it matches `previous` and the file has not been touched
+    since, the file already holds these bytes and the write is skipped.
+    """
+    payload = _encode(session_data, file_path)
+    digest = _payload_digest(payload)
+    if previous is not None and previous[0] == digest:
+        try:
+            if os.stat(file_path).st_mtime_ns == previous[1]:
+                return previous
+        except OSError:
+            pass
+    
+    tmp_path = file_path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return digest, os.stat(file_path).st_mtime_ns
+
+
+def _stream_json(
+    f, progress: Optional[Callable[[int], None]] = None
+) -> Dict[str, Any]:
+    """Parse a JSON session object key by key, reporting how many keys were read."""
+    session_data = {}
+    for count, (key, value) in enumerate(ijson.kvitems(f, '', use_float=True), 1):
+        session_data[key] = value
+        if progress is not None and count % STREAM_PROGRESS_INTERVAL == 0:
+            progress(count)
+    return session_data
+
+
+def _read_session_file(
+    file_path: str, progress: Optional[Callable[[int], None]] = None
+) -> Dict[str, Any]:
+    """
+    Read and parse a session file.
+    
+    Very large JSON files are streamed with ijson, so malformed input is
+    rejected as soon as it is reached and progress can be reported.
+    Other large files are parsed straight from a read-only memory map,
+    avoiding a second in-memory copy of the file.
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if HAS_IJSON and size >= STREAM_THRESHOLD and _is_json(f.read(64)):
+            f.seek(0)
+            return _stream_json(f, progress)
+        f.seek(0)
+        
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return _decode(view)
+        return _decode(f.read())
+
+
+class SessionSignals(QObject):
+    """Signals for session workers."""
+
+    saved = pyqtSignal(str, object)  # (file path, file fingerprint)
+    loaded = pyqtSignal(dict, str)  # (session data, file path)
+    progress = pyqtSignal(int)  # keys read so far
+    error = pyqtSignal(str)
+
+
+class SessionSaveWorker(QRunnable):
+    """Worker for writing a session file in background thread."""
+
+    def __init__(
+        self,
+        session_data: Dict[str, Any],
+        file_path: str,
+        previous: Optional[Tuple[int, int]] = None,
+    ):
+        super().__init__()
+        self.session_data = session_data
+        self.file_path = file_path
+        self.previous = previous
+        self.signals = SessionSignals()
+
+    def run(self):
+        """Serialize and write the session."""
+        try:
+            fingerprint = _write_session_file(
+                self.session_data, self.file_path, self.previous
+            )
+            self.signals.saved.emit(self.file_path, fingerprint)
+        except Exception as e:
+            self.signals.error.emit(f"Failed to save session: {str(e)}")
+            traceback.print_exc()
+
+
+class SessionLoadWorker(QRunnable):
+    """Worker for reading a session file in background thread."""
+
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = SessionSignals()
+
+    def run(self):
+        """Read and parse the session."""
+        try:
+            session_data = _read_session_file(
+                self.file_path, self.signals.progress.emit
+            )
+            self.signals.loaded.emit(session_data, self.file_path)
+        except Exception as e:
+            self.signals.error.emit(f"Failed to load session: {str(e)}")
+            traceback.print_exc()
 
 
 class SessionService(QObject):
     """
     Service for saving and loading analysis sessions.
     
-    Saves all parameter values to JSON file so users don't need
+    Saves all parameter values to a session file (MessagePack for
+    .psess when msgpack is installed, JSON otherwise) so users don't need
     to re-enter parameters when reopening the application.
+    The *_async variants do the file I/O in a background thread and
+    report back through session_saved / session_loaded / error.
     """
     
     session_saved = pyqtSignal(str)  # file path
     session_loaded = pyqtSignal(dict)  # parameters
+    load_progress = pyqtSignal(int)  # keys read so far (large files only)
     error = pyqtSignal(str)
     
     # Session file version for compatibility
@@ -26,10 +314,54 @@ class SessionService(QObject):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # One long-lived worker thread: session I/O is rare but latency
+        # sensitive, and running requests one at a time keeps saves to the
+        # same file in order
+        self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(1)
+        self.thread_pool.setExpiryTimeout(-1)
+        # Last session written and its path, reused for delta saves
+        self._last_saved: Optional[Dict[str, Any]] = None
+        self._last_saved_path: str = ""
+        # Fingerprint of each file written, to skip rewriting identical bytes
+        self._fingerprints: Dict[str, Tuple[int, int]] = {}
+    
+    def _build_session_data(self, model, file_path: str) -> Dict[str, Any]:
+        """
+        Snapshot model parameters plus session metadata.
+        
+        Saving again to the file this service last wrote only refreshes
+        the parameters the model reports as dirty; any other target gets
+        a full snapshot.
+        """
+        if self._last_saved is not None and file_path == self._last_saved_path:
+            session_data = dict(self._last_saved)
+            for name in model.dirty_params:
+                session_data[name] = getattr(model, name)
+        else:
+            session_data = model.to_dict()
+        session_data['_session_version'] = self.SESSION_VERSION
+        session_data['_las_filename'] = model.las_filename
+        
+        model.clear_dirty_params()
+        self._last_saved = session_data
+        self._last_saved_path = file_path
+        return session_data
+    
+    def _on_saved(self, file_path: str, fingerprint: Tuple[int, int]):
+        """Remember what was written and publish the save."""
+        self._fingerprints[file_path] = fingerprint
+        self.session_saved.emit(file_path)
+    
+    def _on_save_error(self, message: str):
+        """Forget cached state so the next save is a full one."""
+        self._last_saved = None
+        self._fingerprints.clear()
+        self.error.emit(message)
     
     def save_session(self, model, file_path: str) -> bool:
         """
-        Save current session parameters to JSON file.
+        Save current session parameters to a session file.
         
         Args:
             model: AppModel instance with all parameters
@@ -39,23 +371,22 @@ class SessionService(QObject):
             True if successful, False otherwise
         """
         try:
-            session_data = self._model_to_dict(model)
-            session_data['_session_version'] = self.SESSION_VERSION
-            session_data['_las_filename'] = model.las_filename
+            fingerprint = _write_session_file(
+                self._build_session_data(model, file_path),
+                file_path,
+                self._fingerprints.get(file_path),
+            )
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
-            
-            self.session_saved.emit(file_path)
+            self._on_saved(file_path, fingerprint)
             return True
             
         except Exception as e:
-            self.error.emit(f"Failed to save session: {str(e)}")
+            self._on_save_error(f"Failed to save session: {str(e)}")
             return False
     
     def load_session(self, file_path: str) -> Optional[Dict]:
         """
-        Load session parameters from JSON file.
+        Load session parameters from a session file.
         
         Args:
             file_path: Path to the session file
@@ -64,22 +395,47 @@ class SessionService(QObject):
             Dictionary with session parameters, or None if failed
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
-            
-            # Check version compatibility
-            version = session_data.get('_session_version', '1.0')
-            if version != self.SESSION_VERSION:
-                # Future: migration logic here
-                pass
-            
-            self.session_loaded.emit(session_data)
+            session_data = _read_session_file(file_path)
+            self._on_loaded(session_data, file_path)
             return session_data
             
         except Exception as e:
             self.error.emit(f"Failed to load session: {str(e)}")
             return None
     
+    def save_session_async(self, model, file_path: str):
+        """
+        Start saving the session in background thread.
+        
+        The model is snapshotted here, on the calling thread, so the
+        worker never touches it.
+        """
+        worker = SessionSaveWorker(
+            self._build_session_data(model, file_path),
+            file_path,
+            self._fingerprints.get(file_path),
+        )
+        worker.signals.saved.connect(self._on_saved)
+        worker.signals.error.connect(self._on_save_error)
+        self.thread_pool.start(worker)
+    
+    def load_session_async(self, file_path: str):
+        """Start loading a session file in background thread."""
+        worker = SessionLoadWorker(file_path)
+        worker.signals.loaded.connect(self._on_loaded)
+        worker.signals.progress.connect(self.load_progress.emit)
+        worker.signals.error.connect(self.error.emit)
+        self.thread_pool.start(worker)
+    
+    def _on_loaded(self, session_data: Dict, file_path: str):
+        """Check the session version and publish the loaded data."""
+        version = session_data.get('_session_version', '1.0')
+        if version != self.SESSION_VERSION:
+            # Future: migration logic here
+            pass
+        
+        self.session_loaded.emit(session_data)
+    
     def apply_session_to_model(self, model, session_data: Dict) -> bool:
         """
         Apply loaded session data to AppModel.
@@ -203,77 +559,3 @@ class SessionService(QObject):
         except Exception as e:
             self.error.emit(f"Failed to apply session: {str(e)}")
             return False
-    
-    def _model_to_dict(self, model) -> Dict[str, Any]:
-        """Convert model parameters to dictionary for saving."""
-        return {
-            # Analysis mode
-            'analysis_mode': model.analysis_mode,
-            'selected_formations': model.selected_formations,
-            
-            # VShale parameters
-            'vsh_baseline_method': model.vsh_baseline_method,
-            'gr_min_manual': model.gr_min_manual,
-            'gr_max_manual': model.gr_max_manual,
-            'vsh_methods': model.vsh_methods,
-            
-            # Matrix parameters
-            'rho_matrix': model.rho_matrix,
-            'dt_matrix': model.dt_matrix,
-            
-            # Fluid parameters
-            'rho_fluid': model.rho_fluid,
-            'dt_fluid': model.dt_fluid,
-            
-            # Shale parameters
-            'shale_approach': model.shale_approach,
-            'rho_shale': model.rho_shale,
-            'dt_shale': model.dt_shale,
-            'nphi_shale': model.nphi_shale,
-            
-            # Archie parameters
-            'lithology_preset': model.lithology_preset,
-            'a': model.a,
-            'm': model.m,
-            'n': model.n,
-            
-            # Resistivity parameters
-            'rw': model.rw,
-            'rsh': model.rsh,
-            
-            # Permeability parameters
-            'perm_C': model.perm_C,
-            'perm_P': model.perm_P,
-            'perm_Q': model.perm_Q,
-            
-            # Swirr parameters
-            'swirr_method': model.swirr_method,
-            'buckles_preset': model.buckles_preset,
-            'k_buckles': model.k_buckles,
-            
-            # Cutoff parameters
-            'vsh_cutoff': model.vsh_cutoff,
-            'phi_cutoff': model.phi_cutoff,
-            'sw_cutoff': model.sw_cutoff,
-            
-            # Sw Parameters
-            'sw_methods': model.sw_methods,
-            'sw_primary_method': model.sw_primary_method,
-            'ws_qv': model.ws_qv,
-            'ws_b': model.ws_b,
-            'dw_swb': model.dw_swb,
-            'dw_rwb': model.dw_rwb,
-            
-            # Merge settings
-            'merge_step': model.merge_step,
-            'merge_gap_limit': model.merge_gap_limit,
-            
-            # Core settings
-            'core_depth_unit': model.core_depth_unit,
-            'core_max_dist': model.core_max_dist,
-            
-            # Gas correction (v1.2)
-            'gas_correction_enabled': model.gas_correction_enabled,
-            'gas_nphi_factor': model.gas_nphi_factor,
-            'gas_rhob_factor': model.gas_rhob_factor,
-        }
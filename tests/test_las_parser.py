@@ -0,0 +1,43 @@
+"""
+Unit tests for LAS buffer decoding.
+"""
+
+import io
+
+import pytest
+
+from modules.las_parser import LASParser, decode_las_bytes
+
+
+LAS_TEXT = """~Version
+VERS.   2.0 : CWLS log ASCII Standard -VERSION 2.0
+WRAP.    NO : One line per depth step
+~Well
+STRT.FT 1000.0 : START DEPTH
+STOP.FT 1001.0 : STOP DEPTH
+STEP.FT    0.5 : STEP
+NULL.  -999.25 : NULL VALUE
+COMP.  Société Pétrolière : COMPANY
+WELL.  TEST-1 : WELL
+~Curve Information
+DEPT.FT    : Depth
+GR  .API   : Gamma ray
+~ASCII
+1000.0 45.0
+1000.5 60.0
+1001.0 75.0
+"""
+
+
+class TestLasDecoding:
+
+    @pytest.mark.parametrize('encoding', ['utf-8', 'utf-8-sig', 'cp1252', 'latin-1'])
+    def test_header_characters_survive(self, encoding):
+        parser = LASParser()
+        assert parser.read_las_from_buffer(io.BytesIO(LAS_TEXT.encode(encoding)))
+        assert parser.well_info['company'] == 'Société Pétrolière'
+        assert len(parser.data) == 3
+
+    def test_undecodable_bytes_are_kept(self):
+        # 0x81 is unassigned in cp1252; latin-1 still maps it
+        assert decode_las_bytes(b'\x81abc') == '\x81abc'
@@ -0,0 +1,93 @@
+"""
+Unit tests for core-calibrated Wyllie-Rose permeability coefficients.
+"""
+
+import pytest
+import numpy as np
+
+from services.analysis_service import AnalysisService, _bounded_lstsq_2d
+
+
+class FakeCore:
+    """Core data exposing the CoreDataHandler accessors used by the fit."""
+
+    def __init__(self, depths, porosity, perm):
+        self.depths = depths
+        self.porosity = porosity
+        self.perm = perm
+
+    def get_core_porosity(self):
+        return self.depths, self.porosity
+
+    def get_core_permeability(self):
+        return self.depths, self.perm
+
+
+def make_core(C, P, Q, k_buckles=0.03, noise=0.0, n=40):
+    """Synthetic core samples following K = C * phi^P / Swirr^Q."""
+    rng = np.random.default_rng(7)
+    depths = np.linspace(2000.0, 2040.0, n)
+    phi = rng.uniform(0.08, 0.28, n)
+    swirr = np.clip(k_buckles / phi, 0.05, 0.8)
+    perm = C * phi**P / swirr**Q
+    perm *= 10 ** rng.normal(0.0, noise, n)
+    return FakeCore(depths, phi, perm)
+
+
+class TestCorePermeabilityFit:
+
+    def test_recovers_known_coefficients(self):
+        core = make_core(C=8581.0, P=4.4, Q=2.0)
+
+        C, P, Q = AnalysisService()._fit_perm_to_core(core, 0.03, 2.0)
+
+        assert C == pytest.approx(8581.0, rel=0.01)
+        assert P == pytest.approx(4.4, abs=0.01)
+        assert Q == 2.0
+
+    def test_recovers_coefficients_from_noisy_core(self):
+        core = make_core(C=3000.0, P=3.5, Q=1.5, noise=0.05, n=200)
+
+        C, P, Q = AnalysisService()._fit_perm_to_core(core, 0.03, 1.5)
+
+        # C is extrapolated to phi = 1, so compare permeability in range
+        phi = np.array([0.1, 0.2])
+        swirr = 0.03 / phi
+        expected = 3000.0 * phi**3.5 / swirr**1.5
+        assert P == pytest.approx(3.5, abs=0.2)
+        assert C * phi**P / swirr**Q == pytest.approx(expected, rel=0.05)
+        assert Q == 1.5
+
+    def test_coefficients_stay_within_bounds(self):
+        # Permeability that falls with porosity would need a negative P
+        core = make_core(C=8581.0, P=4.4, Q=2.0)
+        core.porosity = np.sort(core.porosity)
+        core.perm = np.sort(core.perm)[::-1]
+
+        C, P, Q = AnalysisService()._fit_perm_to_core(core, 0.03, 2.0)
+
+        assert 10 <= C <= 50000
+        assert 2 <= P <= 8
+
+    def test_bounded_solve_matches_constrained_solver(self):
+        optimize = pytest.importorskip('scipy.optimize')
+        rng = np.random.default_rng(3)
+        lower, upper = np.array([1.0, 2.0]), np.array([np.log10(50000), 8.0])
+        for _ in range(50):
+            phi = rng.uniform(0.05, 0.3, 30)
+            A = np.column_stack([np.ones_like(phi), np.log10(phi)])
+            b = rng.normal(0.0, 3.0) + rng.normal(0.0, 6.0) * A[:, 1]
+            b += rng.normal(0.0, 0.2, phi.size)
+
+            x = _bounded_lstsq_2d(A, b, lower, upper)
+            expected = optimize.lsq_linear(A, b, bounds=(lower, upper)).x
+
+            assert np.sum((A @ x - b) ** 2) == pytest.approx(
+                np.sum((A @ expected - b) ** 2), rel=1e-6, abs=1e-9
+            )
+            assert np.all((lower <= x) & (x <= upper))
+
+    def test_too_few_samples(self):
+        core = make_core(C=8581.0, P=4.4, Q=2.0, n=4)
+
+        assert AnalysisService()._fit_perm_to_core(core, 0.03, 2.0) is None
@@ -10,6 +10,7 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from services import session_service
 from services.session_service import SessionService
 
 
@@ -66,6 +67,14 @@ class MockModel:
         self.phi_cutoff = 0.08
         self.sw_cutoff = 0.6
         
+        # Sw
+        self.sw_methods = ["Simandoux"]
+        self.sw_primary_method = "Simandoux"
+        self.ws_qv = 0.2
+        self.ws_b = 1.0
+        self.dw_swb = 0.1
+        self.dw_rwb = 0.2
+        
         # Merge
         self.merge_step = 0.5
         self.merge_gap_limit = 5.0
@@ -79,8 +88,20 @@ class MockModel:
         self.gas_nphi_factor = 0.30
         self.gas_rhob_factor = 0.15
         
+        # Session parameters changed since the last save
+        self.dirty_params = set()
+        
         # LAS filename
         self.las_filename = "test.las"
+    
+    def clear_dirty_params(self):
+        self.dirty_params = set()
+    
+    def to_dict(self):
+        return {
+            k: v for k, v in vars(self).items()
+            if k not in ('dirty_params', 'las_filename')
+        }
 
 
 class TestSessionSaveLoad:
@@ -110,6 +131,79 @@ class TestSessionSaveLoad:
             if os.path.exists(file_path):
                 os.unlink(file_path)
     
+    def test_save_session_leaves_no_temp_file(self):
+        """Test that saving replaces the target and cleans up the temp file."""
+        service = SessionService()
+        model = MockModel()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'session.json')
+            with open(file_path, 'w') as f:
+                f.write('stale')
+            
+            assert service.save_session(model, file_path) is True
+            assert os.listdir(tmp_dir) == ['session.json']
+            
+            with open(file_path, 'r') as f:
+                data = json.load(f)
+            assert data['rw'] == 0.05
+    
+    def test_resave_writes_dirty_params(self):
+        """Test that saving again to the same file picks up dirty parameters."""
+        service = SessionService()
+        model = MockModel()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'session.json')
+            assert service.save_session(model, file_path) is True
+            
+            model.rw = 0.08
+            model.dirty_params.add('rw')
+            assert service.save_session(model, file_path) is True
+            
+            with open(file_path, 'r') as f:
+                data = json.load(f)
+            assert data['rw'] == 0.08
+            assert data['rho_matrix'] == 2.65
+            assert model.dirty_params == set()
+    
+    def test_unchanged_resave_skips_write(self):
+        """Test that saving identical parameters again leaves the file alone."""
+        service = SessionService()
+        model = MockModel()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'session.json')
+            assert service.save_session(model, file_path) is True
+            inode = os.stat(file_path).st_ino
+            
+            assert service.save_session(model, file_path) is True
+            assert os.stat(file_path).st_ino == inode
+            
+            model.rw = 0.08
+            model.dirty_params.add('rw')
+            assert service.save_session(model, file_path) is True
+            assert os.stat(file_path).st_ino != inode
+    
+    def test_save_numpy_values(self):
+        """Test that numpy parameter values are saved as plain numbers."""
+        np = pytest.importorskip('numpy')
+        service = SessionService()
+        model = MockModel()
+        model.rw = np.float32(0.25)
+        model.k_buckles = np.float64(0.03)
+        model.merge_step = np.int64(1)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'session.json')
+            assert service.save_session(model, file_path) is True
+            
+            with open(file_path, 'r') as f:
+                data = json.load(f)
+            assert data['rw'] == 0.25
+            assert data['k_buckles'] == 0.03
+            assert data['merge_step'] == 1
+    
     def test_load_session(self):
         """Test loading session from file."""
         service = SessionService()
@@ -137,6 +231,86 @@ class TestSessionSaveLoad:
             if os.path.exists(file_path):
                 os.unlink(file_path)
     
+    def test_load_large_session(self, monkeypatch):
+        """Test loading a session above the memory-map threshold."""
+        monkeypatch.setattr(session_service, 'MMAP_THRESHOLD', 0)
+        service = SessionService()
+        model = MockModel()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'session.json')
+            assert service.save_session(model, file_path) is True
+            
+            loaded = service.load_session(file_path)
+            assert loaded is not None
+            assert loaded['rho_matrix'] == 2.65
+            assert loaded['sw_methods'] == ["Simandoux"]
+    
+    def test_psess_round_trip(self):
+        """Test that a .psess session loads back whichever format it was written in."""
+        service = SessionService()
+        model = MockModel()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'session.psess')
+            assert service.save_session(model, file_path) is True
+            
+            with open(file_path, 'rb') as f:
+                is_json = f.read(1) == b'{'
+            assert is_json != session_service.HAS_MSGPACK
+            
+            loaded = service.load_session(file_path)
+            assert loaded is not None
+            assert loaded['rw'] == 0.05
+            assert loaded['vsh_methods'] == ["Linear"]
+    
+    def test_stream_large_json_session(self, monkeypatch):
+        """Test that large JSON sessions are streamed and report progress."""
+        pytest.importorskip('ijson')
+        monkeypatch.setattr(session_service, 'STREAM_THRESHOLD', 0)
+        monkeypatch.setattr(session_service, 'STREAM_PROGRESS_INTERVAL', 10)
+        
+        session_data = {f'key_{i}': float(i) for i in range(25)}
+        session_data['vsh_methods'] = ["Linear", "Larionov"]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'session.json')
+            with open(file_path, 'w') as f:
+                json.dump(session_data, f)
+            
+            counts = []
+            loaded = session_service._read_session_file(file_path, counts.append)
+            assert loaded == session_data
+            assert counts == [10, 20]
+    
+    def test_compressed_session_round_trip(self):
+        """Test that .psess.zst sessions are compressed and load back."""
+        pytest.importorskip('zstandard')
+        service = SessionService()
+        model = MockModel()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'session.psess.zst')
+            assert service.save_session(model, file_path) is True
+            
+            with open(file_path, 'rb') as f:
+                assert f.read(4) == session_service.ZSTD_MAGIC
+            
+            loaded = service.load_session(file_path)
+            assert loaded is not None
+            assert loaded['perm_C'] == 8581.0
+    
+    def test_compressed_session_requires_zstandard(self, monkeypatch):
+        """Test that a .zst save fails instead of writing plain data."""
+        monkeypatch.setattr(session_service, 'HAS_ZSTD', False)
+        service = SessionService()
+        model = MockModel()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'session.psess.zst')
+            assert service.save_session(model, file_path) is False
+            assert not os.path.exists(file_path)
+    
     def test_apply_session_to_model(self):
         """Test applying loaded session to model."""
         service = SessionService()
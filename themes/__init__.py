@@ -9,13 +9,12 @@ from .colors import (
     PLOT_COLORS,
     get_color,
     get_plot_color,
+    palette,
     set_current_theme,
     get_colors_dict,
     is_dark_theme,
 )
 from .theme_manager import ThemeManager
-from .light import LIGHT_THEME
-from .dark import DARK_THEME
 
 __all__ = [
     "ThemeManager",
@@ -26,7 +25,21 @@ __all__ = [
     "PLOT_COLORS",
     "get_color",
     "get_plot_color",
+    "palette",
     "set_current_theme",
     "get_colors_dict",
     "is_dark_theme",
 ]
+
+
+def __getattr__(name):
+    # Theme stylesheets are rendered on first access rather than at import
+    if name == "LIGHT_THEME":
+        from .light import LIGHT_THEME
+
+        return LIGHT_THEME
+    if name == "DARK_THEME":
+        from .dark import DARK_THEME
+
+        return DARK_THEME
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
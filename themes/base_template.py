@@ -0,0 +1,423 @@
+"""
+Shared QSS template for the Petrophyter PyQt themes.
+
+Placeholders such as ``{background}`` and ``{primary}`` are filled from a
+theme's ``*_COLORS`` palette; literal QSS braces are doubled.
+"""
+
+import sys
+from dataclasses import asdict, dataclass, fields
+
+
+@dataclass(frozen=True, slots=True)
+class ThemeColors:
+    """Immutable color palette for one application theme."""
+
+    background: str
+    surface: str
+    surface_alt: str
+    surface_hover: str
+    surface_pressed: str
+    primary: str
+    primary_dark: str
+    primary_darker: str
+    primary_light: str
+    text: str
+    text_secondary: str
+    text_disabled: str
+    border: str
+    border_light: str
+    success: str
+    warning: str
+    error: str
+    white: str
+    tooltip_bg: str
+    tooltip_text: str
+    handle: str
+    splitter_pressed: str
+    tooltip_border: str
+    collapsible_header: str
+    collapsible_header_hover: str
+    collapsible_toggle: str
+
+    def __post_init__(self):
+        # Interned so color lookups hand out one canonical string per value
+        for field in fields(self):
+            object.__setattr__(
+                self, field.name, sys.intern(getattr(self, field.name))
+            )
+
+
+THEME_TEMPLATE = """
+    QMainWindow {{
+        background-color: {background};
+    }}
+    QWidget {{
+        background-color: {background};
+        color: {text};
+    }}
+    QGroupBox {{
+        font-weight: bold;
+        border: 1px solid {border};
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: {background};
+        color: {text};
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+        color: {text};
+    }}
+    QTabWidget {{
+        background-color: {background};
+    }}
+    QTabWidget::pane {{
+        border: 1px solid {border};
+        border-radius: 5px;
+        background-color: {background};
+    }}
+    QTabBar::tab {{
+        background-color: {surface_alt};
+        color: {text};
+        border: 1px solid {border};
+        padding: 8px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }}
+    QTabBar::tab:selected {{
+        background-color: {background};
+        border-bottom-color: {background};
+        color: {text};
+    }}
+    QTabBar::tab:hover {{
+        background-color: {surface_hover};
+    }}
+    QScrollArea {{
+        border: none;
+        background-color: {background};
+    }}
+    QScrollArea > QWidget > QWidget {{
+        background-color: {background};
+    }}
+    QAbstractScrollArea::viewport {{
+        background-color: {background};
+    }}
+    QFrame {{
+        background-color: {background};
+        color: {text};
+    }}
+    QGraphicsView, QListView, QTreeView {{
+        background-color: {surface};
+        color: {text};
+    }}
+    QLabel {{
+        background-color: transparent;
+        color: {text};
+    }}
+    QLineEdit {{
+        background-color: {surface};
+        color: {text};
+        border: 1px solid {border};
+        border-radius: 4px;
+        padding: 4px 8px;
+    }}
+    QTextEdit, QPlainTextEdit {{
+        background-color: {surface};
+        color: {text};
+        border: 1px solid {border};
+        border-radius: 4px;
+    }}
+    FigureCanvas, FigureCanvasQTAgg {{
+        background-color: {surface};
+    }}
+    QToolBar {{
+        background-color: {surface};
+        border: 1px solid {border};
+        border-radius: 4px;
+        spacing: 3px;
+        padding: 4px;
+    }}
+    QTableView {{
+        background-color: {surface};
+        color: {text};
+        gridline-color: {border_light};
+        border: 1px solid {border};
+        border-radius: 4px;
+    }}
+    QTableView::item {{
+        padding: 4px;
+        color: {text};
+        background-color: {surface};
+    }}
+    QTableView::item:selected {{
+        background-color: {primary};
+        color: {white};
+    }}
+    QHeaderView::section {{
+        background-color: {surface_alt};
+        color: {text};
+        padding: 6px;
+        border: none;
+        border-right: 1px solid {border_light};
+        border-bottom: 1px solid {border_light};
+        font-weight: bold;
+    }}
+    QDoubleSpinBox, QSpinBox {{
+        padding: 4px 8px;
+        border: 1px solid {border};
+        border-radius: 4px;
+        background-color: {surface};
+        color: {text};
+        min-height: 28px;
+        min-width: 80px;
+    }}
+    QDoubleSpinBox QLineEdit, QSpinBox QLineEdit {{
+        background-color: {surface};
+        color: {text};
+        border: none;
+        padding: 0px;
+    }}
+    QDoubleSpinBox::up-button, QSpinBox::up-button,
+    QDoubleSpinBox::down-button, QSpinBox::down-button {{
+        width: 0px;
+        border: none;
+        background: none;
+    }}
+    QDoubleSpinBox::up-arrow, QSpinBox::up-arrow,
+    QDoubleSpinBox::down-arrow, QSpinBox::down-arrow {{
+        width: 0px;
+        height: 0px;
+    }}
+    QComboBox {{
+        padding: 4px 24px 4px 8px;
+        border: 1px solid {border};
+        border-radius: 4px;
+        background-color: {surface};
+        color: {text};
+        min-height: 26px;
+    }}
+    QComboBox::drop-down {{
+        subcontrol-origin: padding;
+        subcontrol-position: center right;
+        width: 20px;
+        border-left: 1px solid {border};
+        border-top-right-radius: 3px;
+        border-bottom-right-radius: 3px;
+        background-color: {surface_alt};
+    }}
+    QComboBox::drop-down:hover {{
+        background-color: {surface_hover};
+    }}
+    QComboBox::down-arrow {{
+        image: url(icons:chevron-down.svg);
+        width: 12px;
+        height: 12px;
+    }}
+    QComboBox::down-arrow:on {{
+        top: 1px;
+    }}
+    QDoubleSpinBox:focus, QSpinBox:focus, QComboBox:focus {{
+        border-color: {primary};
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: {surface};
+        color: {text};
+        selection-background-color: {primary};
+        selection-color: {white};
+    }}
+    QListWidget {{
+        background-color: {surface};
+        color: {text};
+        border: 1px solid {border};
+    }}
+    QListWidget::item {{
+        color: {text};
+    }}
+    QListWidget::item:selected {{
+        background-color: {primary};
+        color: {white};
+    }}
+    QPushButton {{
+        padding: 6px 12px;
+        border: 1px solid {border};
+        border-radius: 4px;
+        background-color: {surface_alt};
+        color: {text};
+    }}
+    QPushButton:hover {{
+        background-color: {surface_hover};
+    }}
+    QPushButton:pressed {{
+        background-color: {surface_pressed};
+    }}
+    QRadioButton, QCheckBox {{
+        background-color: transparent;
+        color: {text};
+    }}
+    QSlider::groove:horizontal {{
+        height: 6px;
+        background: {border_light};
+        border-radius: 3px;
+    }}
+    QSlider::handle:horizontal {{
+        background: {primary};
+        width: 16px;
+        height: 16px;
+        margin: -5px 0;
+        border-radius: 8px;
+    }}
+    QSlider::sub-page:horizontal {{
+        background: {primary};
+        border-radius: 3px;
+    }}
+    QProgressBar {{
+        border: 1px solid {border};
+        border-radius: 4px;
+        text-align: center;
+        background-color: {surface};
+        color: {text};
+    }}
+    QProgressBar::chunk {{
+        background-color: {success};
+        border-radius: 3px;
+    }}
+    QSplitter {{
+        background-color: {background};
+    }}
+    QSplitter::handle:horizontal {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 transparent, stop:0.4 {handle}, stop:0.6 {handle}, stop:1 transparent);
+        width: 6px;
+        margin: 2px 0px;
+    }}
+    QSplitter::handle:horizontal:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 transparent, stop:0.3 {primary}, stop:0.7 {primary}, stop:1 transparent);
+    }}
+    QSplitter::handle:horizontal:pressed {{
+        background: {splitter_pressed};
+    }}
+    QStatusBar {{
+        background-color: {surface_alt};
+        color: {text};
+    }}
+    QToolTip {{
+        background-color: {tooltip_bg};
+        color: {tooltip_text};
+        border: 1px solid {tooltip_border};
+        padding: 4px;
+        border-radius: 3px;
+    }}
+    QLineEdit, QTextEdit, QPlainTextEdit {{
+        selection-background-color: {primary};
+        selection-color: {white};
+    }}
+    QSpinBox, QDoubleSpinBox, QComboBox {{
+        selection-background-color: {primary};
+        selection-color: {white};
+    }}
+    #collapsibleHeader {{
+        background-color: {collapsible_header};
+        border: 1px solid {border};
+        border-radius: 4px;
+        padding: 6px 8px;
+    }}
+    #collapsibleHeader:hover {{
+        background-color: {collapsible_header_hover};
+    }}
+    #collapsibleContent {{
+        border: 1px solid {border};
+        border-top: none;
+        border-bottom-left-radius: 4px;
+        border-bottom-right-radius: 4px;
+        background-color: {background};
+    }}
+    QLabel#collapsibleToggle {{
+        font-size: 10px;
+        color: {collapsible_toggle};
+        background: transparent;
+    }}
+    QLabel#collapsibleTitle {{
+        font-weight: bold;
+        background: transparent;
+    }}
+    QPushButton#toolbarButton {{
+        border: 1px solid {border};
+        border-radius: 6px;
+        background-color: {surface_alt};
+        font-size: 14px;
+        min-width: 0px;
+    }}
+    QPushButton#toolbarButton:hover {{
+        background-color: {surface_hover};
+    }}
+    QPushButton#toolbarButton:pressed {{
+        background-color: {surface_pressed};
+    }}
+    QPushButton#runButton {{
+        background-color: {primary};
+        color: {white};
+        font-weight: bold;
+        padding: 10px;
+        border-radius: 5px;
+    }}
+    QPushButton#runButton:hover {{
+        background-color: {primary_dark};
+    }}
+    QPushButton#runButton:disabled {{
+        background-color: {primary_light};
+    }}
+    QPushButton#mergeButton {{
+        background-color: {success};
+        color: {white};
+    }}
+    QPushButton#helpButton {{
+        text-align: left;
+        padding: 5px;
+        color: {text_secondary};
+    }}
+    QLabel#lasInfoLabel {{
+        color: {text_secondary};
+        background-color: transparent;
+    }}
+    QLabel#lasInfoLabel[state="loaded"] {{
+        color: {success};
+    }}
+    QLabel#lasInfoLabel[state="files"] {{
+        color: {primary};
+    }}
+    QLabel#fileInfoLabel {{
+        color: {success};
+        background-color: transparent;
+    }}
+    QLabel#hintLabel, QLabel#noteLabel {{
+        color: {text_secondary};
+        background-color: transparent;
+    }}
+    QLabel#noteLabel {{
+        font-style: italic;
+    }}
+    QLabel#subsectionLabel {{
+        font-weight: 600;
+        color: {text_secondary};
+        padding: 4px 0px 2px 0px;
+        border-bottom: 1px solid {border_light};
+        margin-top: 8px;
+        background: transparent;
+    }}
+    QLabel#miniLabel {{
+        font-weight: 500;
+        font-size: 11px;
+        color: {text_secondary};
+        background: transparent;
+    }}
+"""
+
+
+def render_theme(colors: ThemeColors) -> str:
+    """Render the QSS template with the given theme colors."""
+    return THEME_TEMPLATE.format(**asdict(colors))
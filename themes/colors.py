@@ -6,7 +6,9 @@ This ensures consistent theming across the application and makes it easy
 to maintain and update color schemes.
 """
 
-from typing import Dict
+import sys
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 # =============================================================================
 # SEMANTIC COLOR DEFINITIONS
@@ -141,11 +143,24 @@ PLOT_COLORS: Dict[str, str] = {
     "DEFAULT_SCATTER": "#1E90FF",
 }
 
+# Intern every hex value so get_color() hands out one canonical string each
+for _colors in (LIGHT_COLORS, DARK_COLORS, PLOT_COLORS):
+    for _name, _value in _colors.items():
+        _colors[_name] = sys.intern(_value)
+del _colors, _name, _value
+
+# Read-only palettes per theme, with light values filling any dark gaps
+_PALETTES: Dict[str, Mapping[str, str]] = {
+    "light": MappingProxyType(dict(LIGHT_COLORS)),
+    "dark": MappingProxyType({**LIGHT_COLORS, **DARK_COLORS}),
+}
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
 _current_theme = "light"
+_current_is_dark = False
 
 
 def set_current_theme(theme: str):
@@ -155,8 +170,9 @@ def set_current_theme(theme: str):
     Args:
         theme: Theme name ('light' or 'dark')
     """
-    global _current_theme
+    global _current_theme, _current_is_dark
     _current_theme = theme
+    _current_is_dark = theme == "dark"
 
 
 def get_color(color_name: str, theme: str = None) -> str:
@@ -180,8 +196,30 @@ def get_color(color_name: str, theme: str = None) -> str:
     if theme is None:
         theme = _current_theme
 
-    colors = DARK_COLORS if theme == "dark" else LIGHT_COLORS
-    return colors.get(color_name, LIGHT_COLORS.get(color_name, "#000000"))
+    # The palettes already carry the light fallback, so one lookup suffices
+    return _PALETTES["dark" if theme == "dark" else "light"].get(color_name, "#000000")
+
+
+def palette(theme: str = None) -> Mapping[str, str]:
+    """
+    Get the read-only palette for the specified theme.
+
+    Lets callers that need several colors look them up in one mapping
+    instead of calling get_color() once per color.
+
+    Args:
+        theme: Theme name ('light' or 'dark'). If None, uses current theme.
+
+    Returns:
+        Read-only mapping of semantic color names to hex strings
+
+    Example:
+        >>> palette('dark')['bg_primary']
+        '#1E1E1E'
+    """
+    if theme is None:
+        theme = _current_theme
+    return _PALETTES["dark" if theme == "dark" else "light"]
 
 
 def get_plot_color(color_name: str) -> str:
@@ -232,5 +270,5 @@ def is_dark_theme(theme: str = None) -> bool:
         True if dark theme, False otherwise
     """
     if theme is None:
-        theme = _current_theme
+        return _current_is_dark
     return theme == "dark"
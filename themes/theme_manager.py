@@ -2,12 +2,17 @@
 Theme manager for switching between light and dark themes.
 """
 
+import importlib
+import logging
+import weakref
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QPalette, QColor
-from PyQt6.QtCore import QSettings
+from PyQt6.QtCore import QDir, QObject, QSettings, Qt, pyqtSignal
 
-from .light import LIGHT_THEME, LIGHT_COLORS
-from .dark import DARK_THEME, DARK_COLORS
 from .colors import (
     get_color,
     get_plot_color,
@@ -17,19 +22,38 @@ from .colors import (
     PLOT_COLORS,
 )
 
+logger = logging.getLogger(__name__)
+
 
-class ThemeManager:
+class ThemeManager(QObject):
     """Manages application theme switching."""
 
     LIGHT = "light"
     DARK = "dark"
 
-    def __init__(self, app: QApplication, icons_dir: str):
+    # Emitted with the new theme name after it has been applied
+    theme_changed = pyqtSignal(str)
+
+    def __init__(self, app: QApplication, icons_dir: str, parent=None):
+        super().__init__(parent)
         self.app = app
         self.icons_dir = icons_dir
         self.settings = QSettings("Petrophyter", "Theme")
         self._current_theme = self.settings.value("theme", self.LIGHT)
-        self._theme_changed_callbacks = []
+        self._is_dark = self._current_theme == self.DARK
+        self._theme_applied = False
+        self._color_cache = {}
+        self._colors_cache = {}
+        self._loaded_themes = {}
+        # (callback reference, connected slot) per on_theme_changed callback
+        self._callback_slots = []
+
+        # Stylesheets reference icons as "icons:<file>" so no per-apply
+        # path substitution is needed
+        QDir.addSearchPath("icons", icons_dir)
+
+        # Flush the persisted theme to disk once, when the app exits
+        app.aboutToQuit.connect(self.settings.sync)
 
     def get_current_theme(self) -> str:
         """Get the current theme name."""
@@ -40,35 +64,57 @@ class ThemeManager:
         if theme not in [self.LIGHT, self.DARK]:
             theme = self.LIGHT
 
+        # Re-applying the active theme only re-parses the same stylesheet
+        if theme == self._current_theme and self._theme_applied:
+            return
+
         self._current_theme = theme
-        self.settings.setValue("theme", theme)
+        self._is_dark = theme == self.DARK
+        if self.settings.value("theme") != theme:
+            self.settings.setValue("theme", theme)
+        self._color_cache.clear()
+        self._colors_cache.clear()
 
         # Update global current theme for color lookups
         set_current_theme(theme)
 
-        colors = LIGHT_COLORS if theme == self.LIGHT else DARK_COLORS
-        stylesheet = LIGHT_THEME if theme == self.LIGHT else DARK_THEME
+        colors, stylesheet = self._load_theme(theme)
 
         # Apply palette
         palette = self.app.palette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(colors["background"]))
-        palette.setColor(QPalette.ColorRole.Base, QColor(colors["surface"]))
+        palette.setColor(QPalette.ColorRole.Window, QColor(colors.background))
+        palette.setColor(QPalette.ColorRole.Base, QColor(colors.surface))
         palette.setColor(
-            QPalette.ColorRole.AlternateBase, QColor(colors["surface_alt"])
+            QPalette.ColorRole.AlternateBase, QColor(colors.surface_alt)
         )
-        palette.setColor(QPalette.ColorRole.Text, QColor(colors["text"]))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(colors["text"]))
-        palette.setColor(QPalette.ColorRole.Button, QColor(colors["surface_alt"]))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(colors["text"]))
+        palette.setColor(QPalette.ColorRole.Text, QColor(colors.text))
+        palette.setColor(QPalette.ColorRole.WindowText, QColor(colors.text))
+        palette.setColor(QPalette.ColorRole.Button, QColor(colors.surface_alt))
+        palette.setColor(QPalette.ColorRole.ButtonText, QColor(colors.text))
         self.app.setPalette(palette)
 
         # Apply stylesheet
-        final_stylesheet = stylesheet.replace("{{ICONS_DIR}}", self.icons_dir)
-        self.app.setStyleSheet(final_stylesheet)
+        self.app.setStyleSheet(stylesheet)
+
+        self._theme_applied = True
+        self.theme_changed.emit(theme)
+
+    def _load_theme(self, theme: str):
+        """
+        Import a theme module the first time it is needed.
 
-        # Notify callbacks
-        for callback in self._theme_changed_callbacks:
-            callback(theme)
+        Returns:
+            Tuple of (colors dict, rendered stylesheet), cached per theme
+        """
+        loaded = self._loaded_themes.get(theme)
+        if loaded is None:
+            module = importlib.import_module(f".{theme}", package=__package__)
+            prefix = theme.upper()
+            loaded = self._loaded_themes[theme] = (
+                getattr(module, f"{prefix}_COLORS"),
+                getattr(module, f"{prefix}_THEME"),
+            )
+        return loaded
 
     def toggle_theme(self):
         """Toggle between light and dark themes."""
@@ -76,13 +122,51 @@ class ThemeManager:
         self.set_theme(new_theme)
         return new_theme
 
+    @staticmethod
+    def _callback_ref(callback):
+        """Weak reference for bound methods, strong reference otherwise."""
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            return weakref.WeakMethod(callback)
+        return lambda: callback
+
     def on_theme_changed(self, callback):
-        """Register a callback for theme changes."""
-        self._theme_changed_callbacks.append(callback)
+        """
+        Register a callback for theme changes.
+
+        The callback is queued, so it runs on the next event loop iteration
+        after set_theme has returned. Bound methods are held weakly, so
+        callbacks of deleted objects are dropped automatically, and an
+        exception in one callback is logged without affecting the others.
+        """
+        ref = self._callback_ref(callback)
+
+        def slot(theme):
+            callback = ref()
+            if callback is None:
+                self._disconnect_slot(ref, slot)
+                return
+            try:
+                callback(theme)
+            except Exception:
+                logger.exception("Theme change callback %r failed", callback)
+
+        self._callback_slots.append((ref, slot))
+        self.theme_changed.connect(slot, Qt.ConnectionType.QueuedConnection)
+
+    def remove_callback(self, callback):
+        """Unregister a callback previously passed to on_theme_changed."""
+        for ref, slot in tuple(self._callback_slots):
+            if ref() == callback:
+                self._disconnect_slot(ref, slot)
+
+    def _disconnect_slot(self, ref, slot):
+        """Disconnect a callback's slot and forget it."""
+        self._callback_slots.remove((ref, slot))
+        self.theme_changed.disconnect(slot)
 
     def is_dark(self) -> bool:
         """Check if current theme is dark."""
-        return self._current_theme == self.DARK
+        return self._is_dark
 
     def get_color(self, color_name: str) -> str:
         """
@@ -94,18 +178,29 @@ class ThemeManager:
         Returns:
             Color hex string
         """
-        return get_color(color_name, self._current_theme)
+        key = (self._current_theme, color_name)
+        color = self._color_cache.get(key)
+        if color is None:
+            color = self._color_cache[key] = get_color(color_name, self._current_theme)
+        return color
 
-    def get_colors(self) -> dict:
+    def get_colors(self) -> Mapping[str, str]:
         """
         Get all colors for current theme.
 
         Returns:
-            Dictionary of all color definitions
+            Read-only mapping of all color definitions
         """
-        return get_colors_dict(self._current_theme)
-
-    def get_plot_color(self, color_name: str) -> str:
+        colors = self._colors_cache.get(self._current_theme)
+        if colors is None:
+            colors = self._colors_cache[self._current_theme] = MappingProxyType(
+                get_colors_dict(self._current_theme)
+            )
+        return colors
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_plot_color(color_name: str) -> str:
         """
         Get plot color value (consistent across themes).
 
@@ -3,25 +3,47 @@ Main Window for Petrophyter PyQt
 The main application window.
 """
 
+import os
+from operator import attrgetter
+
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QPushButton,
     QLabel,
     QTabWidget,
     QStatusBar,
-    QSizePolicy,
     QSplitter,
     QMessageBox,
+    QFileDialog,
+)
+from PyQt6.QtCore import (
+    Qt,
+    QRunnable,
+    QSignalBlocker,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
 
 from themes.colors import get_color
 
+from models.app_model import (
+    AppModel,
+    QC_DIRTY,
+    RESULTS_DIRTY,
+    SUMMARY_DIRTY,
+    EXPORT_DIRTY,
+)
+from services.analysis_service import AnalysisService
+from services.merge_service import MergeService
+from services.export_service import ExportService
+from services.session_service import SessionService, SESSION_EXTENSION, HAS_ZSTD
+from services.las_load_service import LasLoadService
+from services.qc_service import QcService
 from .sidebar_panel import SidebarPanel
+from .widgets.about_dialog import AboutDialog
 from .tabs import (
     QCTab,
     PetrophysicsTab,
@@ -31,34 +53,148 @@ from .tabs import (
     ExportTab,
 )
 
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QIcon
-import traceback
-import threading
+from modules.formation_tops import FormationTops
+from modules.core_handler import CoreDataHandler
 
-import sys
-import os
+CURVE_TYPES = ("GR", "RHOB", "NPHI", "DT", "RT")
+
+# (owner attribute, signal, slot attribute path[, connection type])
+_CONNECTIONS = (
+    # Sidebar signals
+    ("sidebar", "las_files_selected", "_on_las_files_selected"),
+    ("sidebar", "merge_requested", "_on_merge_requested"),
+    ("sidebar", "tops_file_selected", "_on_tops_file_selected"),
+    ("sidebar", "core_file_selected", "_on_core_file_selected"),
+    ("sidebar", "run_analysis_clicked", "_on_run_analysis"),
+    ("sidebar", "download_merged_clicked", "_on_download_merged"),
+    ("sidebar", "calculate_rw_rsh_clicked", "_on_calculate_rw_rsh"),
+    ("sidebar", "calculate_shale_clicked", "_on_calculate_shale"),
+    ("sidebar", "apply_shale_clicked", "_on_apply_shale"),
+    ("sidebar", "calculate_perm_clicked", "_on_calculate_perm"),
+    ("sidebar", "params_widget_created", "_on_params_widget_created"),
+    # Session signals (v1.2)
+    ("sidebar", "new_project_clicked", "_on_new_project"),
+    ("sidebar", "save_session_clicked", "_on_save_session"),
+    ("sidebar", "load_session_clicked", "_on_load_session"),
+    ("sidebar", "help_clicked", "_on_about_triggered"),
+    # Theme toggle signal
+    ("sidebar", "theme_toggle_clicked", "_on_theme_toggle"),
+    # Analysis service signals
+    ("analysis_service", "started", "_on_analysis_started"),
+    ("analysis_service", "progress", "_on_analysis_progress"),
+    (
+        "analysis_service",
+        "completed",
+        "_on_analysis_completed",
+        Qt.ConnectionType.QueuedConnection,
+    ),
+    ("analysis_service", "error", "_on_analysis_error"),
+    ("analysis_service", "estimation_started", "_on_estimation_started"),
+    ("analysis_service", "estimated", "_on_estimated"),
+    ("analysis_service", "estimation_error", "_on_estimation_error"),
+    # Merge service signals
+    ("merge_service", "started", "_on_merge_started"),
+    ("merge_service", "progress", "_on_merge_progress"),
+    ("merge_service", "completed", "_on_merge_completed"),
+    ("merge_service", "error", "_on_merge_error"),
+    # LAS load service signals
+    ("las_load_service", "file_loaded", "_finish_las_load"),
+    ("las_load_service", "files_loaded", "_finish_prepare_merge"),
+    ("las_load_service", "metadata_ready", "_on_las_metadata"),
+    ("las_load_service", "error", "_on_las_load_error"),
+    # QC service signals
+    ("qc_service", "completed", "_on_qc_completed"),
+    ("qc_service", "error", "_on_qc_error"),
+    # Session service signals
+    ("session_service", "session_saved", "_on_session_saved"),
+    ("session_service", "session_loaded", "_on_session_loaded"),
+    ("session_service", "load_progress", "_on_session_load_progress"),
+    ("session_service", "error", "_on_session_error"),
+    # Export signals
+    ("export_tab", "export_csv", "_on_export_csv"),
+    ("export_tab", "export_excel", "_on_export_excel"),
+    ("export_service", "export_complete", "export_tab.show_export_success"),
+    ("export_service", "export_error", "export_tab.show_export_error"),
+    # Refresh stale tabs when they are shown
+    ("tab_widget", "currentChanged", "_lazy_update_tab"),
+    # Model signals
+    ("model", "data_loaded", "_on_data_loaded"),
+    ("model", "analysis_complete", "_on_results_updated"),
+    # New project: every panel clears itself when the model is reset
+    ("model", "model_reset", "sidebar.reset_ui"),
+    ("model", "model_reset", "qc_tab.reset_ui"),
+    ("model", "model_reset", "petro_tab.reset_ui"),
+    ("model", "model_reset", "log_tab.reset_ui"),
+    ("model", "model_reset", "diag_tab.reset_ui"),
+    ("model", "model_reset", "summary_tab.reset_ui"),
+    ("model", "model_reset", "export_tab.reset_ui"),
+)
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Sidebar parameter estimations run in the background:
+# kind -> (description, handler for the result)
+_ESTIMATIONS = {
+    "rw_rsh": ("Rw/Rsh", "_show_rw_rsh_estimate"),
+    "shale": ("shale parameters", "_show_shale_estimate"),
+    "perm": ("permeability coefficients", "_show_perm_estimate"),
+}
+
+# Sidebar widgets restored from the model after a session load:
+# (sidebar attribute, setter, model attributes, pass attributes as one dict)
+_UI_BINDINGS = (
+    (
+        "shale_params_widget",
+        "set_params",
+        ("rho_shale", "dt_shale", "nphi_shale"),
+        False,
+    ),
+    (
+        "sw_models_widget",
+        "set_params",
+        ("sw_methods", "sw_primary_method", "ws_qv", "ws_b", "dw_swb", "dw_rwb"),
+        True,
+    ),
+    (
+        "gas_correction_widget",
+        "set_params",
+        ("gas_correction_enabled", "gas_nphi_factor", "gas_rhob_factor"),
+        False,
+    ),
+)
 
-from models.app_model import AppModel
-from services.analysis_service import AnalysisService
-from services.merge_service import MergeService
-from services.export_service import ExportService
-from services.session_service import SessionService
-from .sidebar_panel import SidebarPanel
-from .widgets.about_dialog import AboutDialog
-from .tabs.qc_tab import QCTab
-from .tabs.petrophysics_tab import PetrophysicsTab
-from .tabs.log_display_tab import LogDisplayTab
-from .tabs.diagnostics_tab import DiagnosticsTab
-from .tabs.summary_tab import SummaryTab
-from .tabs.export_tab import ExportTab
-
-from modules.las_parser import LASParser
-from modules.qc_module import QCModule
-from modules.formation_tops import FormationTops
-from modules.core_handler import CoreDataHandler
+# Compressed sessions are only offered when zstandard is installed
+_SESSION_SAVE_FILTERS = [
+    "Session Files (*.psess)",
+    *(["Compressed Session Files (*.psess.zst)"] if HAS_ZSTD else []),
+    "All Files (*)",
+]
+_SESSION_LOAD_FILTERS = [
+    "Session Files (*.psess *.psess.zst *.json)"
+    if HAS_ZSTD
+    else "Session Files (*.psess *.json)",
+    "All Files (*)",
+]
+
+_TITLE_HTML = "<h1 style='color: {primary}; text-align: center;'>Petrophyter</h1>"
+_SUBTITLE_HTML = (
+    "<p style='color: {secondary}; background-color: transparent; "
+    "text-align: center;'>Petrophysics Master: Semi-Automatic LAS QC & Analysis</p>"
+)
+
+
+def _total_size(entries: list) -> int:
+    """Total size in bytes of the LasFileEntry items that could be stat'ed."""
+    return sum(entry.size or 0 for entry in entries)
+
+
+class _ReleaseWorker(QRunnable):
+    """Drop the last references to discarded project data off the UI thread."""
+
+    def __init__(self, refs: list):
+        super().__init__()
+        self.refs = refs
+
+    def run(self):
+        self.refs.clear()
 
 
 class MainWindow(QMainWindow):
@@ -66,6 +202,10 @@ class MainWindow(QMainWindow):
     Main application window for Petrophyter PyQt.
     """
 
+    # Emitted once per applied theme, after the application stylesheet has
+    # been swapped; widgets with their own inline colors subscribe to it
+    theme_refreshed = pyqtSignal()
+
     def __init__(self, theme_manager=None):
         super().__init__()
 
@@ -80,16 +220,51 @@ class MainWindow(QMainWindow):
         self.merge_service = MergeService()
         self.export_service = ExportService()
         self.session_service = SessionService()
+        self.las_load_service = LasLoadService()
+        self.qc_service = QcService()
 
         # Store loaded LAS parsers for merge
         self._loaded_parsers = []
         self._loaded_file_names = []
+        # Parameter estimations (kinds of _ESTIMATIONS) still running
+        self._running_estimations = set()
+
+        # Path of the session file currently being loaded
+        self._session_load_path = ""
+        # Session file dialog, created on first use and reused afterwards
+        self._session_dialog = None
+
+        # Per-theme (primary, secondary, title_html, subtitle_html)
+        self._theme_cache = {}
+
+        # Coalesce rapid theme toggles into a single widget refresh
+        self._pending_theme = None
+        self._theme_refresh_timer = QTimer(self)
+        self._theme_refresh_timer.setSingleShot(True)
+        self._theme_refresh_timer.setInterval(30)
+        self._theme_refresh_timer.timeout.connect(self._do_theme_refresh)
+
+        # Analysis progress is applied at most once per timer tick
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._flush_progress)
 
         # Setup UI
         self._setup_ui()
         self._setup_connections()
 
-        # Listen for theme changes
+        # Sidebar widgets and bound setters for _update_ui_from_model,
+        # resolved from _UI_BINDINGS as each widget is built (collapsed
+        # sidebar sections create theirs on first expand)
+        self._ui_setters = []
+        for widget_name, *_ in _UI_BINDINGS:
+            if self.sidebar.is_built(widget_name):
+                self._bind_ui_setters(widget_name)
+
+        # Listen for theme changes; each tab restyles its own cards
+        for tab in self._tabs:
+            self.theme_refreshed.connect(tab.refresh_theme)
         if self.theme_manager:
             self.theme_manager.on_theme_changed(self._handle_theme_change)
 
@@ -102,7 +277,8 @@ class MainWindow(QMainWindow):
         # Set initial theme button state
         if self.theme_manager:
             self.sidebar.update_theme_button(self.theme_manager.is_dark())
-            self._handle_theme_change(self.theme_manager.get_current_theme())
+            self._pending_theme = self.theme_manager.get_current_theme()
+            self._do_theme_refresh()
 
     def _setup_ui(self):
         """Setup the main UI layout."""
@@ -132,14 +308,11 @@ class MainWindow(QMainWindow):
         content_layout.setContentsMargins(10, 10, 10, 10)
 
         # Title
-        from PyQt6.QtWidgets import QLabel
-
-        self.title_label = QLabel(
-            f"<h1 style='color: {get_color('primary')}; text-align: center;'>Petrophyter</h1>"
-        )
-        self.subtitle_label = QLabel(
-            f"<p style='color: {get_color('text_secondary')}; background-color: transparent; text-align: center;'>Petrophysics Master: Semi-Automatic LAS QC & Analysis</p>"
+        _, _, title_html, subtitle_html = self._get_theme_header(
+            self.theme_manager.get_current_theme() if self.theme_manager else "light"
         )
+        self.title_label = QLabel(title_html)
+        self.subtitle_label = QLabel(subtitle_html)
 
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -165,6 +338,26 @@ class MainWindow(QMainWindow):
         self.tab_widget.addTab(self.summary_tab, "📋 Summary")
         self.tab_widget.addTab(self.export_tab, "💾 Export")
 
+        self._tabs = (
+            self.qc_tab,
+            self.petro_tab,
+            self.log_tab,
+            self.diag_tab,
+            self.summary_tab,
+            self.export_tab,
+        )
+        # Model data domains each tab displays
+        self._tab_masks = {
+            self.qc_tab: QC_DIRTY,
+            self.petro_tab: RESULTS_DIRTY | SUMMARY_DIRTY,
+            self.log_tab: RESULTS_DIRTY,
+            self.diag_tab: RESULTS_DIRTY,
+            self.summary_tab: SUMMARY_DIRTY,
+            self.export_tab: EXPORT_DIRTY,
+        }
+        # Tabs whose display is stale; refreshed when they are next shown
+        self._dirty_tabs = set()
+
         content_layout.addWidget(self.tab_widget)
 
         splitter.addWidget(content_widget)
@@ -189,51 +382,12 @@ class MainWindow(QMainWindow):
         self.statusBar.showMessage("Ready. Load a LAS file to begin.")
 
     def _setup_connections(self):
-        """Connect signals and slots."""
-        # Sidebar signals
-        self.sidebar.las_files_selected.connect(self._on_las_files_selected)
-        self.sidebar.merge_requested.connect(self._on_merge_requested)
-        self.sidebar.tops_file_selected.connect(self._on_tops_file_selected)
-        self.sidebar.core_file_selected.connect(self._on_core_file_selected)
-        self.sidebar.run_analysis_clicked.connect(self._on_run_analysis)
-        self.sidebar.download_merged_clicked.connect(self._on_download_merged)
-        self.sidebar.calculate_rw_rsh_clicked.connect(self._on_calculate_rw_rsh)
-        self.sidebar.calculate_shale_clicked.connect(self._on_calculate_shale)
-        self.sidebar.apply_shale_clicked.connect(self._on_apply_shale)
-        self.sidebar.calculate_perm_clicked.connect(self._on_calculate_perm)
-
-        # Session signals (v1.2)
-        self.sidebar.new_project_clicked.connect(self._on_new_project)
-        self.sidebar.save_session_clicked.connect(self._on_save_session)
-        self.sidebar.load_session_clicked.connect(self._on_load_session)
-        self.sidebar.help_clicked.connect(self._on_about_triggered)
-
-        # Theme toggle signal
-        self.sidebar.theme_toggle_clicked.connect(self._on_theme_toggle)
-
-        # Analysis service signals
-        self.analysis_service.started.connect(self._on_analysis_started)
-        self.analysis_service.progress.connect(self._on_analysis_progress)
-        self.analysis_service.completed.connect(
-            self._on_analysis_completed, type=Qt.ConnectionType.QueuedConnection
-        )
-        self.analysis_service.error.connect(self._on_analysis_error)
-
-        # Merge service signals
-        self.merge_service.started.connect(self._on_merge_started)
-        self.merge_service.progress.connect(self._on_merge_progress)
-        self.merge_service.completed.connect(self._on_merge_completed)
-        self.merge_service.error.connect(self._on_merge_error)
-
-        # Export signals
-        self.export_tab.export_csv.connect(self._on_export_csv)
-        self.export_tab.export_excel.connect(self._on_export_excel)
-        self.export_service.export_complete.connect(self.export_tab.show_export_success)
-        self.export_service.export_error.connect(self.export_tab.show_export_error)
-
-        # Model signals
-        self.model.data_loaded.connect(self._on_data_loaded)
-        self.model.analysis_complete.connect(self._on_results_updated)
+        """Connect signals and slots listed in _CONNECTIONS."""
+        for owner, signal, slot, *conn_type in _CONNECTIONS:
+            getattr(getattr(self, owner), signal).connect(
+                attrgetter(slot)(self),
+                type=conn_type[0] if conn_type else Qt.ConnectionType.AutoConnection,
+            )
 
     def _on_about_triggered(self):
         """Show the About dialog."""
@@ -246,29 +400,39 @@ class MainWindow(QMainWindow):
             self.theme_manager.toggle_theme()
 
     def _handle_theme_change(self, theme: str):
-        """Refresh widgets when theme changes."""
+        """Schedule a widget refresh for the new theme."""
+        self._pending_theme = theme
+        self._theme_refresh_timer.start()
+
+    def _do_theme_refresh(self):
+        """Refresh widgets for the most recently applied theme."""
+        theme = self._pending_theme
         is_dark = self.theme_manager.is_dark() if self.theme_manager else False
-        if hasattr(self, "sidebar"):
+        # Repaint the window once, after every widget has been restyled
+        self.setUpdatesEnabled(False)
+        try:
             self.sidebar.update_theme_button(is_dark)
-            self.sidebar.refresh_theme()
-        for tab in [
-            getattr(self, "qc_tab", None),
-            getattr(self, "petrophysics_tab", None),
-            getattr(self, "log_display_tab", None),
-            getattr(self, "diagnostics_tab", None),
-            getattr(self, "summary_tab", None),
-            getattr(self, "export_tab", None),
-        ]:
-            if tab and hasattr(tab, "refresh_theme"):
-                tab.refresh_theme()
-        if hasattr(self, "title_label"):
-            self.title_label.setText(
-                f"<h1 style='color: {get_color('primary')}; text-align: center;'>Petrophyter</h1>"
-            )
-        if hasattr(self, "subtitle_label"):
-            self.subtitle_label.setText(
-                f"<p style='color: {get_color('text_secondary')}; background-color: transparent; text-align: center;'>Petrophysics Master: Semi-Automatic LAS QC & Analysis</p>"
+            # Direct connections: subscribers restyle before updates resume
+            self.theme_refreshed.emit()
+            _, _, title_html, subtitle_html = self._get_theme_header(theme)
+            self.title_label.setText(title_html)
+            self.subtitle_label.setText(subtitle_html)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _get_theme_header(self, theme: str) -> tuple:
+        """Return (primary, secondary, title_html, subtitle_html) for a theme."""
+        cached = self._theme_cache.get(theme)
+        if cached is None:
+            primary = get_color("primary", theme)
+            secondary = get_color("text_secondary", theme)
+            cached = self._theme_cache[theme] = (
+                primary,
+                secondary,
+                _TITLE_HTML.format(primary=primary),
+                _SUBTITLE_HTML.format(secondary=secondary),
             )
+        return cached
 
     # =========================================================================
     # LAS FILE HANDLING
@@ -284,76 +448,111 @@ class MainWindow(QMainWindow):
             self._prepare_merge(file_paths)
 
     def _load_single_las(self, file_path: str):
-        """Load a single LAS file."""
+        """Load a single LAS file in the background."""
+        name = os.path.basename(file_path)
+        self.statusBar.showMessage(f"Loading {name}...")
+        self.sidebar.set_las_loading(True, f"Loading {name}...")
+        self.las_load_service.load_file(file_path)
+
+    def _finish_las_load(self, parser, entry):
+        """Apply a parsed LAS file (with its LasFileEntry) to the model."""
+        self.sidebar.set_las_loading(False)
         try:
-            self.statusBar.showMessage(f"Loading {os.path.basename(file_path)}...")
-
-            parser = LASParser()
-            with open(file_path, "r") as f:
-                success = parser.read_las_from_buffer(f)
-
-            if success and parser.data is not None:
+            # Update the model as one change: a single data_loaded emit once
+            # every field is consistent. The QC report follows from qc_service.
+            with QSignalBlocker(self.model):
                 self.model.las_parser = parser
                 self.model.las_data = parser.data
-                self.model.las_filename = file_path
+                self.model.las_filename = entry.path
                 self.model.calculated = False
                 self.model.merge_report = None
+                self.model.qc_report = None
+            self.model.data_loaded.emit()
 
-                # Run QC
-                well_name = parser.well_info.get("well_name", "Unknown")
-                qc = QCModule(parser.data, well_name)
-                self.model.qc_report = qc.run_qc()
-
-                # Update sidebar
-                self.sidebar.update_las_info(
-                    file_path, len(parser.data), len(parser.data.columns)
-                )
-
-                # Update curve mapping
-                curves = parser.get_available_curves()
-                detected = {}
-                for ctype in ["GR", "RHOB", "NPHI", "DT", "RT"]:
-                    found = parser.find_curve_by_type(ctype)
-                    if found:
-                        detected[ctype] = found
-                self.sidebar.update_available_curves(curves, detected)
-
-                self.statusBar.showMessage(
-                    f"Loaded: {os.path.basename(file_path)} ({len(parser.data)} rows)"
-                )
-            else:
-                QMessageBox.critical(self, "Error", "Failed to load LAS file")
-                self.statusBar.showMessage("Failed to load LAS file")
+            # Run QC in the background
+            well_name = parser.well_info.get("well_name", "Unknown")
+            self.qc_service.run_qc(parser.data, well_name)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load LAS file:\n{str(e)}")
-            self.statusBar.showMessage("Error loading file")
+            # Update sidebar
+            n_rows, n_cols = parser.data.shape
+            self.sidebar.update_las_info(entry, n_rows, n_cols)
 
-    def _prepare_merge(self, file_paths: list):
-        """Prepare multiple LAS files for merge."""
-        try:
-            self._loaded_parsers = []
-            self._loaded_file_names = []
-
-            for path in file_paths:
-                parser = LASParser()
-                with open(path, "r") as f:
-                    if parser.read_las_from_buffer(f):
-                        self._loaded_parsers.append(parser)
-                        self._loaded_file_names.append(os.path.basename(path))
-
-            if len(self._loaded_parsers) >= 2:
-                self.sidebar.update_multiple_files_info(len(self._loaded_parsers))
-                self.statusBar.showMessage(
-                    f"{len(self._loaded_parsers)} LAS files ready for merge"
-                )
-            else:
-                QMessageBox.warning(
-                    self, "Warning", "Need at least 2 valid LAS files to merge"
-                )
+            # Update curve mapping
+            curves, detected = self._detect_curves(parser)
+            self.sidebar.update_available_curves(curves, detected)
+
+            self.statusBar.showMessage(f"Loaded: {entry.basename} ({n_rows} rows)")
 
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to prepare files:\n{str(e)}")
+            self._on_las_load_error(entry.path, f"Failed to load LAS file:\n{str(e)}")
+
+    def _on_qc_completed(self, qc_report):
+        """Store a finished QC report and refresh the QC tab."""
+        if self.model.las_data is None:
+            return  # Project was cleared while QC was running
+        self.model.qc_report = qc_report
+        self._update_all_tabs()
+
+    def _on_qc_error(self, error: str):
+        """Handle a QC run that failed; the loaded data stays usable."""
+        if self.model.las_data is None:
+            return  # Project was cleared while QC was running
+        self.statusBar.showMessage("Data QC failed")
+        QMessageBox.warning(self, "Data QC Error", error)
+
+    def _detect_curves(self, parser) -> tuple:
+        """
+        Return (available curves, detected curve mapping) for a parser.
+
+        The result is cached on the parser, since it only depends on the
+        parser's curve set.
+        """
+        cached = getattr(parser, "_petro_detect_cache", None)
+        if cached is None:
+            curves = parser.get_available_curves()
+            detected = {
+                ctype: found
+                for ctype in CURVE_TYPES
+                if (found := parser.find_curve_by_type(ctype))
+            }
+            cached = parser._petro_detect_cache = (curves, detected)
+        return cached
+
+    def _on_las_load_error(self, file_path: str, error: str):
+        """Handle a LAS file that could not be loaded."""
+        self.sidebar.set_las_loading(False)
+        QMessageBox.critical(self, "Error", error)
+        self.statusBar.showMessage("Error loading file")
+
+    def _prepare_merge(self, file_paths: list):
+        """Prepare multiple LAS files for merge (parsed in the background)."""
+        # A merge of the previous inputs no longer applies
+        self.merge_service.cancel()
+        self._loaded_parsers.clear()
+        self._loaded_file_names.clear()
+        message = f"Reading {len(file_paths)} LAS files..."
+        self.statusBar.showMessage(message)
+        self.sidebar.set_las_loading(True, message)
+        self.las_load_service.load_files(file_paths)
+
+    def _on_las_metadata(self, entries: list):
+        """Show the size of the selected files while they are parsed."""
+        self.sidebar.show_files_metadata(len(entries), _total_size(entries))
+
+    def _finish_prepare_merge(self, parsers: list, entries: list):
+        """Store the parsed files once every merge input has been read."""
+        self.sidebar.set_las_loading(False)
+        self._loaded_parsers = parsers
+        self._loaded_file_names = [entry.basename for entry in entries]
+
+        n_files = len(parsers)
+        if n_files >= 2:
+            self.sidebar.update_multiple_files_info(n_files, _total_size(entries))
+            self.statusBar.showMessage(f"{n_files} LAS files ready for merge")
+        else:
+            QMessageBox.warning(
+                self, "Warning", "Need at least 2 valid LAS files to merge"
+            )
 
     def _on_merge_requested(self):
         """Handle merge request."""
@@ -361,11 +560,13 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "Need at least 2 LAS files to merge")
             return
 
-        self.sidebar.update_model_from_ui()
+        self.sidebar.flush_parameters()
 
+        # The worker gets its own lists, so clearing ours in place (new
+        # project, new merge inputs) cannot change a merge in progress
         self.merge_service.merge_files(
-            self._loaded_parsers,
-            self._loaded_file_names,
+            list(self._loaded_parsers),
+            list(self._loaded_file_names),
             self.model.merge_step,
             self.model.merge_gap_limit,
         )
@@ -379,45 +580,48 @@ class MainWindow(QMainWindow):
         """Handle merge progress."""
         self.sidebar.set_progress(percent, message)
 
-    def _on_merge_completed(self, merged_df, merge_report):
-        """Handle merge completion."""
+    def _on_merge_completed(self, merged_df, merge_report, parsers: list):
+        """Handle merge completion; parsers are the merge worker's inputs."""
         self.sidebar.set_progress(100, "Complete")
 
-        # Store merged data
-        self.model.las_parser = self._loaded_parsers[0]
-        self.model.las_parser.data = merged_df
-        self.model.las_data = merged_df
-        self.model.las_filename = f"MERGED_{len(self._loaded_parsers)}_files"
-        self.model.merge_report = merge_report
-        self.model.calculated = False
-
-        # Run QC on merged data
-        qc = QCModule(merged_df, merge_report.well_name)
-        self.model.qc_report = qc.run_qc()
+        # Store merged data (single data_loaded emit, which refreshes QC tab)
+        parser = parsers[0]
+        parser.data = merged_df
+        # Curve detection cached for the first input no longer applies
+        parser.__dict__.pop("_petro_detect_cache", None)
+        n_files = len(parsers)
+        with QSignalBlocker(self.model):
+            self.model.las_parser = parser
+            self.model.las_data = merged_df
+            self.model.las_filename = f"MERGED_{n_files}_files"
+            self.model.merge_report = merge_report
+            self.model.calculated = False
+            self.model.qc_report = None
+        self.model.data_loaded.emit()
+        self.model.merge_complete.emit()
+
+        # Run QC on merged data in the background
+        self.qc_service.run_qc(merged_df, merge_report.well_name)
 
         # Update sidebar
-        self.sidebar.update_las_info(
-            self.model.las_filename,
-            len(merged_df),
-            len(merged_df.columns),
-            is_merged=True,
-        )
+        n_rows, n_cols = merged_df.shape
+        self.sidebar.update_las_info(None, n_rows, n_cols, is_merged=True)
 
         # Update curve mapping
-        curves = self.model.las_parser.get_available_curves()
-        detected = {}
-        for ctype in ["GR", "RHOB", "NPHI", "DT", "RT"]:
-            found = self.model.las_parser.find_curve_by_type(ctype)
-            if found:
-                detected[ctype] = found
+        curves, detected = self._detect_curves(self.model.las_parser)
         self.sidebar.update_available_curves(curves, detected)
 
         self.statusBar.showMessage(
-            f"Merged {len(self._loaded_parsers)} files ({len(merged_df)} rows)"
+            f"Merged {n_files} files ({n_rows} rows)"
         )
 
-        # Update QC tab
-        self.qc_tab.update_display()
+        # Only the first parser (now holding the merged data) is still used;
+        # release the other inputs' curve data right away
+        for released in parsers[1:]:
+            released.las = None
+            released.data = None
+        self._loaded_parsers = parsers[:1]
+        self._loaded_file_names = self._loaded_file_names[:1]
 
     def _on_merge_error(self, error: str):
         """Handle merge error."""
@@ -427,8 +631,6 @@ class MainWindow(QMainWindow):
 
     def _on_download_merged(self):
         """Handle merged LAS download."""
-        from PyQt6.QtWidgets import QFileDialog
-
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Merged LAS",
@@ -476,7 +678,7 @@ class MainWindow(QMainWindow):
     def _on_core_file_selected(self, file_path: str):
         """Handle core data file selection."""
         try:
-            self.sidebar.update_model_from_ui()
+            self.sidebar.flush_parameters()
 
             handler = CoreDataHandler()
             with open(file_path, "r") as f:
@@ -516,7 +718,7 @@ class MainWindow(QMainWindow):
             return
 
         # Update model from UI
-        self.sidebar.update_model_from_ui()
+        self.sidebar.flush_parameters()
 
         # Start analysis
         self.analysis_service.run_analysis(self.model)
@@ -526,12 +728,27 @@ class MainWindow(QMainWindow):
         self.sidebar.run_btn.setEnabled(False)
         self.sidebar.set_progress(0, "Analyzing...")
         self.statusBar.showMessage("Running petrophysics analysis...")
+        self._pending_progress = None
+        self._progress_timer.start()
 
     def _on_analysis_progress(self, message: str, percent: int):
-        """Handle analysis progress."""
+        """Handle analysis progress (shown on the next progress timer tick)."""
+        self._pending_progress = (message, percent)
+
+    def _flush_progress(self):
+        """Apply the latest pending analysis progress, if any."""
+        if self._pending_progress is None:
+            return
+        message, percent = self._pending_progress
+        self._pending_progress = None
         self.sidebar.set_progress(percent, message)
         self.statusBar.showMessage(message)
 
+    def _stop_progress_updates(self):
+        """Stop progress coalescing and drop any update not yet shown."""
+        self._progress_timer.stop()
+        self._pending_progress = None
+
     def _on_analysis_completed(self, results, summary):
         """Handle analysis completion."""
         # print(
@@ -540,6 +757,7 @@ class MainWindow(QMainWindow):
         # print(f"[DEBUG MainWindow] results.shape = {results.shape}")
         # print(f"[DEBUG MainWindow] results.columns = {list(results.columns)[:10]}...")
 
+        self._stop_progress_updates()
         self.sidebar.set_progress(100, "Complete")
         self.sidebar.run_btn.setEnabled(True)
 
@@ -554,24 +772,22 @@ class MainWindow(QMainWindow):
         #     f"[DEBUG MainWindow] After storing: model.results is None = {self.model.results is None}"
         # )
 
-        self.statusBar.showMessage("✅ Analysis complete!")
-
         # Explicitly update all tabs (in case signal doesn't propagate)
         # print("[DEBUG MainWindow] Calling _update_all_tabs()")
         self._update_all_tabs()
 
-        # Show success message
-        QMessageBox.information(
-            self,
-            "Analysis Complete",
-            f"Analysis completed successfully!\n\n"
-            f"Net Pay: {summary.get('net_pay', 0):.1f} ft\n"
-            f"Gross Sand: {summary.get('gross_sand', 0):.1f} ft\n"
+        # Non-modal summary so the window stays interactive
+        self.statusBar.showMessage(
+            f"✅ Analysis complete — "
+            f"Net Pay: {summary.get('net_pay', 0):.1f} ft, "
+            f"Gross Sand: {summary.get('gross_sand', 0):.1f} ft, "
             f"N/G Pay: {summary.get('ng_pay', 0) * 100:.1f}%",
+            10000,
         )
 
     def _on_analysis_error(self, error: str):
         """Handle analysis error."""
+        self._stop_progress_updates()
         self.sidebar.set_progress(0, "")
         self.sidebar.run_btn.setEnabled(True)
         QMessageBox.critical(self, "Analysis Error", error)
@@ -586,13 +802,32 @@ class MainWindow(QMainWindow):
         self._update_all_tabs()
 
     def _update_all_tabs(self):
-        """Update all tabs with current results."""
-        self.qc_tab.update_display()
-        self.petro_tab.update_display()
-        self.log_tab.update_display()
-        self.diag_tab.update_display()
-        self.summary_tab.update_display()
-        self.export_tab.update_display()
+        """
+        Update tabs affected by model changes since the last update.
+
+        Only the visible tab is redrawn now; the others are marked dirty and
+        refreshed by _lazy_update_tab when the user switches to them.
+        """
+        flags = self.model.dirty_flags
+        self.model.clear_dirty_flags()
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            self._dirty_tabs.update(
+                tab for tab, mask in self._tab_masks.items() if flags & mask
+            )
+            current = self.tab_widget.currentWidget()
+            if current in self._dirty_tabs:
+                self._dirty_tabs.discard(current)
+                current.update_display()
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+
+    def _lazy_update_tab(self, index: int):
+        """Refresh a tab that went stale while it was hidden."""
+        tab = self.tab_widget.widget(index)
+        if tab in self._dirty_tabs:
+            self._dirty_tabs.discard(tab)
+            tab.update_display()
 
     # =========================================================================
     # PARAMETER CALCULATIONS
@@ -604,13 +839,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "No data loaded")
             return
 
-        self.sidebar.update_model_from_ui()
-        result = self.analysis_service.calculate_rw_rsh(self.model)
-
-        if result:
-            self.sidebar.show_calculated_rw_rsh(result["rw"], result["rsh"])
-        else:
-            QMessageBox.warning(self, "Warning", "Could not calculate Rw/Rsh from data")
+        self.sidebar.flush_parameters()
+        self.analysis_service.estimate_async("rw_rsh", self.model)
 
     def _on_calculate_shale(self):
         """Calculate shale parameters from data."""
@@ -618,21 +848,13 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "No data loaded")
             return
 
-        self.sidebar.update_model_from_ui()
-        result = self.analysis_service.calculate_shale_parameters(self.model)
-
-        if result:
-            self.model.calculated_shale = result
-            self.sidebar.show_calculated_shale(result)
-        else:
-            QMessageBox.warning(
-                self, "Warning", "Could not calculate shale parameters from data"
-            )
+        self.sidebar.flush_parameters()
+        self.analysis_service.estimate_async("shale", self.model)
 
     def _on_apply_shale(self):
         """Apply calculated shale parameters."""
         if self.model.calculated_shale:
-            self.sidebar.shale_params_widget.set_params(
+            self.sidebar.ensure_widget("shale_params_widget").set_params(
                 self.model.calculated_shale["rho_shale"],
                 self.model.calculated_shale["dt_shale"],
                 self.model.calculated_shale["nphi_shale"],
@@ -647,111 +869,68 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please run analysis first")
             return
 
-        results = self.model.results
-
-        if "PHIE" not in results.columns:
+        if "PHIE" not in self.model.results.columns:
             QMessageBox.warning(
                 self, "Warning", "PHIE not calculated. Run analysis first."
             )
             return
 
-        import numpy as np
-
-        # If core data available, use core-based fitting
-        if self.model.core_data is not None:
-            try:
-                from scipy import optimize
-
-                core = self.model.core_data
-
-                # Get core data
-                core_depths, core_perm = core.get_core_permeability()
-                core_depths_por, core_por = core.get_core_porosity()
-
-                if len(core_perm) >= 5 and len(core_por) >= 5:
-                    # Match porosity with permeability at same depths
-                    matched_por = []
-                    matched_perm = []
-                    for i, d in enumerate(core_depths):
-                        idx = np.argmin(np.abs(core_depths_por - d))
-                        if np.abs(core_depths_por[idx] - d) < 0.5:  # Within 0.5 ft
-                            matched_por.append(core_por[idx])
-                            matched_perm.append(core_perm[i])
-
-                    if len(matched_por) >= 5:
-                        matched_por = np.array(matched_por)
-                        matched_perm = np.array(matched_perm)
-
-                        # Estimate Swirr using Buckles
-                        swirr = self.model.k_buckles / matched_por
-                        swirr = np.clip(swirr, 0.05, 0.8)
-
-                        # Fit Wyllie-Rose: K = C * phi^P / Swi^Q
-                        def wyllie_rose(phi, swi, C, P, Q):
-                            return C * (phi**P) / (swi**Q)
-
-                        def objective(params, phi, swi, k):
-                            C, P, Q = params
-                            k_pred = wyllie_rose(phi, swi, C, P, Q)
-                            return np.sum(
-                                (np.log10(k_pred + 0.001) - np.log10(k + 0.001)) ** 2
-                            )
-
-                        # Initial guess
-                        x0 = [8581, 4.4, 2.0]
-                        bounds = [(10, 50000), (2, 8), (0.5, 4)]
-
-                        result = optimize.minimize(
-                            objective,
-                            x0,
-                            args=(matched_por, swirr, matched_perm),
-                            bounds=bounds,
-                            method="L-BFGS-B",
-                        )
-
-                        if result.success:
-                            C, P, Q = result.x
-                            self.sidebar.perm_params_widget.show_calculated_result(
-                                C, P, Q
-                            )
-                            self.statusBar.showMessage(
-                                f"Core-calibrated: C={C:.0f}, P={P:.2f}, Q={Q:.2f}"
-                            )
-                            return
-            except Exception as e:
-                pass  # Fall through to statistical estimation
-
-        # Statistical estimation based on porosity (works without core)
-        try:
-            phie = results["PHIE"].dropna()
-
-            if len(phie) < 10:
-                QMessageBox.warning(self, "Warning", "Insufficient data for regression")
-                return
-
-            phi_mean = phie.mean()
-
-            # Adjust coefficients based on porosity distribution
-            if phi_mean > 0.20:
-                # High porosity - unconsolidated
-                C, P, Q = 10000.0, 4.0, 2.0
-            elif phi_mean > 0.12:
-                # Medium porosity - typical sandstone (Timur defaults)
-                C, P, Q = 8581.0, 4.4, 2.0
-            else:
-                # Low porosity - tight formation
-                C, P, Q = 5000.0, 5.0, 2.2
+        self.analysis_service.estimate_async("perm", self.model)
+
+    def _on_estimation_started(self, kind: str):
+        """Show the sidebar busy indicator while an estimation runs."""
+        self._running_estimations.add(kind)
+        description, _ = _ESTIMATIONS[kind]
+        self.sidebar.set_busy(True, f"Calculating {description}...")
+
+    def _end_estimation(self, kind: str):
+        """Clear the busy indicator once no estimation is running."""
+        self._running_estimations.discard(kind)
+        if not self._running_estimations:
+            self.sidebar.set_busy(False)
+
+    def _on_estimated(self, kind: str, result):
+        """Hand an estimation result to its handler."""
+        self._end_estimation(kind)
+        _, handler = _ESTIMATIONS[kind]
+        getattr(self, handler)(result)
+
+    def _on_estimation_error(self, kind: str, message: str):
+        """Report a failed estimation."""
+        self._end_estimation(kind)
+        description, _ = _ESTIMATIONS[kind]
+        QMessageBox.warning(
+            self, "Error", f"Failed to calculate {description}:\n{message}"
+        )
 
-            self.sidebar.perm_params_widget.show_calculated_result(C, P, Q)
-            self.statusBar.showMessage(
-                f"Estimated from porosity (mean={phi_mean:.3f}): C={C:.0f}, P={P:.2f}, Q={Q:.2f}"
-            )
+    def _show_rw_rsh_estimate(self, result):
+        """Show calculated Rw/Rsh in the sidebar."""
+        if result:
+            self.sidebar.show_calculated_rw_rsh(result["rw"], result["rsh"])
+        else:
+            QMessageBox.warning(self, "Warning", "Could not calculate Rw/Rsh from data")
 
-        except Exception as e:
+    def _show_shale_estimate(self, result):
+        """Store and show calculated shale parameters."""
+        if result:
+            self.model.calculated_shale = result
+            self.sidebar.show_calculated_shale(result)
+        else:
             QMessageBox.warning(
-                self, "Error", f"Failed to calculate coefficients:\n{str(e)}"
+                self, "Warning", "Could not calculate shale parameters from data"
             )
 
+    def _show_perm_estimate(self, result):
+        """Show calculated permeability coefficients in the sidebar."""
+        if result is None:
+            QMessageBox.warning(self, "Warning", "Insufficient data for regression")
+            return
+
+        self.sidebar.ensure_widget("perm_params_widget").show_calculated_result(
+            result["C"], result["P"], result["Q"]
+        )
+        self.statusBar.showMessage(result["message"])
+
     # =========================================================================
     # EXPORT
     # =========================================================================
@@ -774,46 +953,81 @@ class MainWindow(QMainWindow):
 
     def _on_save_session(self):
         """Handle save session button click."""
-        from PyQt6.QtWidgets import QFileDialog
-
         # Update model from UI first
-        self.sidebar.update_model_from_ui()
+        self.sidebar.flush_parameters()
 
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Save Session",
-            "petrophyter_session.json",
-            "Session Files (*.json);;All Files (*)",
+        file_path = self._ask_session_path(
+            "Save Session", QFileDialog.AcceptMode.AcceptSave
         )
 
         if file_path:
-            if self.session_service.save_session(self.model, file_path):
-                self.statusBar.showMessage(f"Session saved to {file_path}")
-                QMessageBox.information(
-                    self, "Session Saved", "Session parameters saved successfully!"
-                )
-            else:
-                QMessageBox.critical(self, "Error", "Failed to save session")
+            self.statusBar.showMessage("Saving session...")
+            self.session_service.save_session_async(self.model, file_path)
 
     def _on_load_session(self):
         """Handle load session button click."""
-        from PyQt6.QtWidgets import QFileDialog
-
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Load Session", "", "Session Files (*.json);;All Files (*)"
+        file_path = self._ask_session_path(
+            "Load Session", QFileDialog.AcceptMode.AcceptOpen
         )
 
         if file_path:
-            session_data = self.session_service.load_session(file_path)
-            if session_data:
-                self.session_service.apply_session_to_model(self.model, session_data)
-                self._update_ui_from_model()
-                self.statusBar.showMessage(f"Session loaded from {file_path}")
-                QMessageBox.information(
-                    self, "Session Loaded", "Session parameters restored!"
-                )
-            else:
-                QMessageBox.critical(self, "Error", "Failed to load session")
+            self._session_load_path = file_path
+            self.statusBar.showMessage("Loading session...")
+            self.session_service.load_session_async(file_path)
+
+    def _ask_session_path(self, title: str, accept_mode) -> str:
+        """
+        Show the session file dialog and return the chosen path ("" if cancelled).
+
+        One dialog is shared by save and load, so it keeps the last
+        directory and file name between uses.
+        """
+        if self._session_dialog is None:
+            self._session_dialog = QFileDialog(self)
+            self._session_dialog.setDefaultSuffix(SESSION_EXTENSION.lstrip("."))
+            self._session_dialog.selectFile("petrophyter_session" + SESSION_EXTENSION)
+
+        dialog = self._session_dialog
+        saving = accept_mode == QFileDialog.AcceptMode.AcceptSave
+        dialog.setWindowTitle(title)
+        dialog.setAcceptMode(accept_mode)
+        # New sessions are always .psess; legacy .json sessions can still be opened
+        dialog.setNameFilters(_SESSION_SAVE_FILTERS if saving else _SESSION_LOAD_FILTERS)
+        dialog.setFileMode(
+            QFileDialog.FileMode.AnyFile
+            if saving
+            else QFileDialog.FileMode.ExistingFile
+        )
+
+        if dialog.exec() and dialog.selectedFiles():
+            return dialog.selectedFiles()[0]
+        return ""
+
+    def _on_session_saved(self, file_path: str):
+        """Handle a session file written by the session service."""
+        self.statusBar.showMessage(f"Session saved to {file_path}", 5000)
+
+    def _on_session_loaded(self, session_data: dict):
+        """Apply a session read by the session service."""
+        self.session_service.apply_session_to_model(self.model, session_data)
+        if self._update_ui_from_model():
+            self.statusBar.showMessage(
+                f"Session loaded from {self._session_load_path}", 5000
+            )
+        else:
+            self.statusBar.showMessage(
+                f"Session loaded from {self._session_load_path} "
+                "(some values could not be shown in the sidebar)"
+            )
+
+    def _on_session_load_progress(self, count: int):
+        """Show how far a large session file has been read."""
+        self.statusBar.showMessage(f"Loading session... {count:,} entries read")
+
+    def _on_session_error(self, error: str):
+        """Handle a failed session save or load."""
+        self.statusBar.showMessage("Session operation failed")
+        QMessageBox.critical(self, "Error", error)
 
     def _on_new_project(self):
         """Handle new project button click - clear all data and reset to fresh state."""
@@ -829,78 +1043,96 @@ class MainWindow(QMainWindow):
             if reply != QMessageBox.StandardButton.Yes:
                 return
 
-        # Reset model data
-        self.model.reset()
+        # Keep the old data alive until the UI is reset, then let a worker
+        # thread drop it so deallocating large frames does not block the UI
+        model = self.model
+        old_refs = [
+            model.las_data,
+            model.las_parser,
+            model.results,
+            model.summary,
+            model.qc_report,
+            model.merge_report,
+            model.formation_tops,
+            model.core_data,
+            *self._loaded_parsers,
+        ]
+
+        # Files still being read or merged belong to the old project
+        self.las_load_service.cancel()
+        self.merge_service.cancel()
 
         # Clear loaded parsers for merge
-        self._loaded_parsers = []
-        self._loaded_file_names = []
-
-        # Reset sidebar UI
-        self.sidebar.reset_ui()
+        self._loaded_parsers.clear()
+        self._loaded_file_names.clear()
+        self._dirty_tabs.clear()
 
-        # Reset all tabs UI to fresh state
-        self.qc_tab.reset_ui()
-        self.petro_tab.reset_ui()
-        self.log_tab.reset_ui()
-        self.diag_tab.reset_ui()
-        self.summary_tab.reset_ui()
-        self.export_tab.reset_ui()
+        # Resetting the model emits model_reset, which resets the sidebar and
+        # every tab; hold repaints until they are all done
+        self.setUpdatesEnabled(False)
+        try:
+            self.model.reset()
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Reset status bar
         self.statusBar.showMessage("Ready. Load a LAS file to begin.")
 
-    def _update_ui_from_model(self):
-        """Update UI widgets from model values after loading session."""
-        # Update sidebar widgets from model values
-        # This refreshes all parameter fields
-        try:
-            # VShale
-            self.sidebar.vsh_params_widget.set_baseline_method(
-                self.model.vsh_baseline_method
-            )
-            self.sidebar.vsh_params_widget.set_gr_range(
-                self.model.gr_min_manual, self.model.gr_max_manual
-            )
-
-            # Matrix
-            self.sidebar.matrix_params_widget.set_params(
-                self.model.rho_matrix, self.model.dt_matrix
-            )
-
-            # Fluid
-            self.sidebar.fluid_params_widget.set_params(
-                self.model.rho_fluid, self.model.dt_fluid
-            )
-
-            # Shale
-            self.sidebar.shale_params_widget.set_params(
-                self.model.rho_shale, self.model.dt_shale, self.model.nphi_shale
-            )
-
-            # Archie
-            self.sidebar.archie_params_widget.set_params(
-                self.model.a, self.model.m, self.model.n
-            )
-
-            # Resistivity
-            self.sidebar.res_params_widget.set_params(self.model.rw, self.model.rsh)
+        QThreadPool.globalInstance().start(_ReleaseWorker(old_refs))
+
+    def _bind_ui_setters(self, widget_name: str) -> list:
+        """
+        Resolve the _UI_BINDINGS setters of one sidebar widget.
+
+        Bindings whose setter is missing are dropped here instead of failing
+        on every load. Returns the newly bound entries.
+        """
+        widget = getattr(self.sidebar, widget_name)
+        bound = [
+            (widget, setter, attrs, as_dict)
+            for name, method_name, attrs, as_dict in _UI_BINDINGS
+            if name == widget_name
+            and (setter := getattr(widget, method_name, None)) is not None
+        ]
+        self._ui_setters.extend(bound)
+        return bound
+
+    def _on_params_widget_created(self, widget_name: str):
+        """Bind a lazily built sidebar widget and show the model's values."""
+        bound = self._bind_ui_setters(widget_name)
+        if bound:
+            self._update_ui_from_model(bound)
+
+    def _update_ui_from_model(self, setters: list = None) -> bool:
+        """
+        Update UI widgets from model values after loading session.
+
+        Only the given bindings are refreshed if ``setters`` is passed.
+        Returns False if a widget rejected one of the values.
+        """
+        if setters is None:
+            setters = self._ui_setters
+        sidebar = self.sidebar
+        model = self.model
+        # Values come from the model, so the widgets' change signals must not
+        # feed them back; repaint the sidebar once at the end
+        blockers = [QSignalBlocker(widget) for widget, _, _, _ in setters]
+        sidebar.setUpdatesEnabled(False)
 
-            # Perm
-            self.sidebar.perm_params_widget.set_params(
-                self.model.perm_C, self.model.perm_P, self.model.perm_Q
-            )
-
-            # Cutoffs
-            self.sidebar.cutoff_params_widget.set_params(
-                self.model.vsh_cutoff, self.model.phi_cutoff, self.model.sw_cutoff
-            )
-
-            # Gas correction (v1.2)
-            self.sidebar.gas_correction_widget.set_params(
-                self.model.gas_correction_enabled,
-                self.model.gas_nphi_factor,
-                self.model.gas_rhob_factor,
-            )
-        except Exception:
-            pass  # Best effort - some widgets may not support set_params
+        try:
+            for _, setter, attrs, as_dict in setters:
+                values = [getattr(model, attr) for attr in attrs]
+                if as_dict:
+                    setter(dict(zip(attrs, values)))
+                else:
+                    setter(*values)
+        except (TypeError, ValueError):
+            # A hand-edited session can carry values the widgets reject;
+            # the model keeps them, the sidebar just stops refreshing here
+            return False
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            # Re-enabling updates schedules a single repaint
+            sidebar.setUpdatesEnabled(True)
+        return True
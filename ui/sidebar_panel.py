@@ -4,6 +4,7 @@ Left panel with file upload and parameter controls.
 """
 
 from PyQt6.QtWidgets import (
+    QAbstractSpinBox,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
@@ -19,9 +20,9 @@ from PyQt6.QtWidgets import (
     QProgressBar,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QSignalBlocker, QSize, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QFont, QIcon, QPainter, QPixmap
 import os
-from themes.colors import get_color
 
 from .widgets.parameter_groups import (
     CollapsibleGroupBox,
@@ -42,6 +43,171 @@ from .widgets.parameter_groups import (
 )
 
 
+# Native dialogs; read-only and without per-directory icon lookups, which are
+# slow on large shared LAS folders
+_OPEN_OPTIONS = (
+    QFileDialog.Option.ReadOnly | QFileDialog.Option.DontUseCustomDirectoryIcons
+)
+
+# Open-file dialogs, one reused instance per kind: (title, name filters, multiple)
+_TEXT_FILTERS = ["Text Files (*.txt *.csv)", "All Files (*)"]
+_OPEN_DIALOGS = {
+    "las": ("Open LAS File(s)", ["LAS Files (*.las *.LAS)", "All Files (*)"], True),
+    "tops": ("Open Formation Tops", _TEXT_FILTERS, False),
+    "core": ("Open Core Data", _TEXT_FILTERS, False),
+}
+
+# Widget signals that restart the parameter debounce: (sidebar attribute, signal)
+_PARAM_SIGNALS = {
+    "curve_mapping_widget": "mapping_changed",
+    "analysis_mode_widget": "mode_changed",
+    "vsh_params_widget": "params_changed",
+    "porosity_method_widget": "params_changed",
+    "matrix_params_widget": "params_changed",
+    "fluid_params_widget": "params_changed",
+    "shale_params_widget": "params_changed",
+    "archie_params_widget": "params_changed",
+    "sw_models_widget": "params_changed",
+    "res_params_widget": "params_changed",
+    "perm_params_widget": "params_changed",
+    "swir_params_widget": "params_changed",
+    "cutoff_params_widget": "params_changed",
+    "gas_correction_widget": "params_changed",
+}
+
+# Parameter groups copied into the model by update_model_from_ui:
+# (sidebar attribute, ((model attribute, get_params() key), ...))
+_GROUP_FIELDS = (
+    (
+        "vsh_params_widget",
+        (
+            ("vsh_baseline_method", "baseline_method"),
+            ("gr_min_manual", "gr_min"),
+            ("gr_max_manual", "gr_max"),
+            ("vsh_methods", "methods"),
+        ),
+    ),
+    ("porosity_method_widget", (("primary_phie_method", "primary_phie_method"),)),
+    (
+        "matrix_params_widget",
+        (("rho_matrix", "rho_matrix"), ("dt_matrix", "dt_matrix")),
+    ),
+    ("fluid_params_widget", (("rho_fluid", "rho_fluid"), ("dt_fluid", "dt_fluid"))),
+    (
+        "shale_params_widget",
+        (
+            ("shale_approach", "approach"),
+            ("rho_shale", "rho_shale"),
+            ("dt_shale", "dt_shale"),
+            ("nphi_shale", "nphi_shale"),
+            # Shale estimation settings (v2.0)
+            ("shale_vsh_threshold", "shale_vsh_threshold"),
+            ("shale_gate_logs", "shale_gate_logs"),
+            ("shale_iqr_filter", "shale_iqr_filter"),
+            # Adaptive shale threshold params (v2.1)
+            ("shale_selection_mode", "shale_selection_mode"),
+            ("shale_vsh_quantile", "shale_vsh_quantile"),
+            ("shale_min_points", "shale_min_points"),
+            ("shale_sweep_tmin", "shale_sweep_tmin"),
+            ("shale_sweep_tmax", "shale_sweep_tmax"),
+            ("shale_sweep_step", "shale_sweep_step"),
+        ),
+    ),
+    (
+        "archie_params_widget",
+        (("lithology_preset", "lithology"), ("a", "a"), ("m", "m"), ("n", "n")),
+    ),
+    (
+        "sw_models_widget",
+        (
+            ("sw_methods", "sw_methods"),
+            ("sw_primary_method", "sw_primary_method"),
+            ("ws_qv", "ws_qv"),
+            ("ws_b", "ws_b"),
+            ("dw_swb", "dw_swb"),
+            ("dw_rwb", "dw_rwb"),
+        ),
+    ),
+    ("res_params_widget", (("rw", "rw"), ("rsh", "rsh"))),
+    ("perm_params_widget", (("perm_C", "C"), ("perm_P", "P"), ("perm_Q", "Q"))),
+    (
+        "swir_params_widget",
+        (
+            ("swirr_method", "method"),
+            ("buckles_preset", "buckles_preset"),
+            ("k_buckles", "k_buckles"),
+        ),
+    ),
+    (
+        "cutoff_params_widget",
+        (
+            ("vsh_cutoff", "vsh_cutoff"),
+            ("phi_cutoff", "phi_cutoff"),
+            ("sw_cutoff", "sw_cutoff"),
+        ),
+    ),
+    # Gas correction (v1.2)
+    (
+        "gas_correction_widget",
+        (
+            ("gas_correction_enabled", "enabled"),
+            ("gas_nphi_factor", "nphi_factor"),
+            ("gas_rhob_factor", "rhob_factor"),
+        ),
+    ),
+)
+_GROUP_FIELDS_BY_WIDGET = dict(_GROUP_FIELDS)
+
+# Attributes created with the parameters section, dropped again if its
+# build fails
+_PARAMS_SECTION_WIDGETS = (*_PARAM_SIGNALS, "sw_models_group")
+
+# Single-value controls copied into the model by update_model_from_ui:
+# (model attribute, sidebar attribute, getter)
+_CONTROL_FIELDS = (
+    # Analysis mode
+    ("analysis_mode", "analysis_mode_widget", "get_mode"),
+    ("selected_formations", "analysis_mode_widget", "get_selected_formations"),
+    # Merge settings
+    ("merge_step", "merge_step_spin", "value"),
+    ("merge_gap_limit", "merge_gap_spin", "value"),
+    # Core settings
+    ("core_depth_unit", "core_unit_combo", "currentText"),
+    ("core_max_dist", "core_dist_spin", "value"),
+)
+
+# Theme toggle button (glyph, tooltip), indexed by whether the theme is dark:
+# a moon offers the dark theme, a sun the light one
+_THEME_BUTTON_STATES = (
+    ("🌙", "Switch to Dark Theme"),
+    ("☀️", "Switch to Light Theme"),
+)
+
+# Pixel size of the theme toggle glyphs
+_THEME_ICON_SIZE = 18
+
+
+def _render_emoji(glyph: str, size: int, ratio: float = 1.0) -> QPixmap:
+    """Rasterize an emoji glyph onto a transparent square pixmap."""
+    pixmap = QPixmap(round(size * ratio), round(size * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    font = QFont()
+    font.setPixelSize(size - 2)
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.drawText(0, 0, size, size, Qt.AlignmentFlag.AlignCenter, glyph)
+    painter.end()
+    return pixmap
+
+
+def _format_size(num_bytes: int) -> str:
+    """Human-readable file size."""
+    if num_bytes < 1024 * 1024:
+        return f"{num_bytes / 1024:.0f} KB"
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
+
 class SidebarPanel(QWidget):
     """
     Left sidebar panel with file upload and parameter controls.
@@ -49,7 +215,9 @@ class SidebarPanel(QWidget):
     """
 
     # Signals
-    las_files_selected = pyqtSignal(list)  # List of file paths
+    # Plain path strings; the files' LasFileEntry metadata is read in the
+    # background and arrives through LasLoadService.metadata_ready
+    las_files_selected = pyqtSignal(list)
     merge_requested = pyqtSignal()
     tops_file_selected = pyqtSignal(str)
     core_file_selected = pyqtSignal(str)
@@ -75,13 +243,40 @@ class SidebarPanel(QWidget):
     # Theme signal
     theme_toggle_clicked = pyqtSignal()
 
+    # A parameter widget of a collapsed section was built (widget attribute)
+    params_widget_created = pyqtSignal(str)
+
     def __init__(self, model, parent=None):
         super().__init__(parent)
         self.model = model
         self.setMinimumWidth(340)  # Slightly wider for better readability
         self.setMaximumWidth(420)  # Increased max width
+
+        # A burst of parameter edits (e.g. holding a spin box arrow) is
+        # copied into the model once, after the edits pause
+        self._param_debounce = QTimer(self)
+        self._param_debounce.setSingleShot(True)
+        self._param_debounce.setInterval(120)
+        self._param_debounce.timeout.connect(self.flush_parameters)
+
+        # Parameter widgets are only built when first needed (the parameters
+        # section on first data load, collapsed sections on first expand):
+        # widget attribute -> callable that builds it, until built
+        self._lazy_sections = {}
+        # Bound readers for update_model_from_ui; filled as widgets are built
+        self._group_readers = []
+        self._control_readers = []
+        # Open-file dialogs by kind, created on first use and then reused
+        self._open_dialogs = {}
+        # Whether the panel shows its initial state, so reset_ui can skip;
+        # cleared by every public method that displays data
+        self._is_reset = True
+
         self._setup_ui()
-        self._connect_signals()
+
+        for _attr, widget_name, _getter in _CONTROL_FIELDS:
+            if self.is_built(widget_name):
+                self._bind_control_readers(widget_name)
 
     def _setup_ui(self):
         """Setup the sidebar UI."""
@@ -109,8 +304,19 @@ class SidebarPanel(QWidget):
         toolbar_layout.addWidget(self.load_session_btn)
         toolbar_layout.setStretchFactor(self.load_session_btn, 1)
 
-        # Theme toggle button (auto icon based on current theme)
-        self.theme_btn = self._create_toolbar_button("🌙", "Switch to Dark Theme")
+        # Theme toggle button (auto icon based on current theme). The glyphs
+        # are rasterized once, so toggling swaps pixmaps instead of shaping
+        # the emoji text through the color-emoji font on every repaint
+        ratio = self.devicePixelRatioF()
+        self._theme_icons = tuple(
+            QIcon(_render_emoji(glyph, _THEME_ICON_SIZE, ratio))
+            for glyph, _tooltip in _THEME_BUTTON_STATES
+        )
+        self.theme_btn = self._create_toolbar_button(
+            "", _THEME_BUTTON_STATES[False][1]
+        )
+        self.theme_btn.setIcon(self._theme_icons[False])
+        self.theme_btn.setIconSize(QSize(_THEME_ICON_SIZE, _THEME_ICON_SIZE))
         self.theme_btn.clicked.connect(self._on_theme_toggle)
         toolbar_layout.addWidget(self.theme_btn)
         toolbar_layout.setStretchFactor(self.theme_btn, 1)
@@ -136,7 +342,7 @@ class SidebarPanel(QWidget):
         # RUN ANALYSIS BUTTON (after data input)
         # =====================================================================
         self.run_btn = QPushButton("🚀 Run Analysis")
-        self.run_btn.setStyleSheet(self._get_run_button_style())
+        self.run_btn.setObjectName("runButton")
         self.run_btn.setEnabled(False)
         self.run_btn.clicked.connect(self.run_analysis_clicked.emit)
         self.content_layout.addWidget(self.run_btn)
@@ -162,8 +368,9 @@ class SidebarPanel(QWidget):
         self.params_frame = QFrame()
         self.params_layout = QVBoxLayout(self.params_frame)
         self.params_layout.setSpacing(5)
-        self._create_parameters_section()
-        self.params_frame.setVisible(False)  # Hidden until data loaded
+        # Hidden until data is loaded; its widgets are built at that point
+        # by update_las_info / update_multiple_files_info
+        self.params_frame.setVisible(False)
         self.content_layout.addWidget(self.params_frame)
 
         # Push remaining space to top
@@ -176,62 +383,22 @@ class SidebarPanel(QWidget):
         self.help_btn = QPushButton("❓ About Petrophyter")
         self.help_btn.setFlat(True)
         self.help_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._apply_help_style()
+        self.help_btn.setObjectName("helpButton")
         self.help_btn.clicked.connect(self.help_clicked.emit)
         main_layout.addWidget(self.help_btn)
 
     def _create_toolbar_button(self, icon: str, tooltip: str) -> QPushButton:
         """Create a styled toolbar button with icon and tooltip."""
-        from themes.colors import get_color
-
         btn = QPushButton(icon)
-        btn.setMinimumHeight(32)
+        # Styled by the application theme stylesheet
+        btn.setObjectName("toolbarButton")
+        # A fixed height keeps the row out of style-driven size negotiation;
+        # the buttons still share the sidebar width equally
+        btn.setFixedHeight(32)
         btn.setToolTip(tooltip)
         btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self._apply_toolbar_style(btn)
         return btn
 
-    def _apply_toolbar_style(self, btn: QPushButton):
-        from themes.colors import get_color
-
-        btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                border: 1px solid {get_color("border")};
-                border-radius: 6px;
-                background-color: {get_color("bg_surface_alt")};
-                font-size: 14px;
-                min-width: 0px;
-            }}
-            QPushButton:hover {{
-                background-color: {get_color("bg_surface_hover")};
-            }}
-            QPushButton:pressed {{
-                background-color: {get_color("bg_surface_pressed")};
-            }}
-            """
-        )
-
-    def _get_run_button_style(self) -> str:
-        """Get stylesheet for Run Analysis button."""
-        from themes.colors import get_color
-
-        return f"""
-            QPushButton {{
-                background-color: {get_color("primary")};
-                color: white;
-                font-weight: bold;
-                padding: 10px;
-                border-radius: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: {get_color("primary_dark")};
-            }}
-            QPushButton:disabled {{
-                background-color: {get_color("primary_light")};
-            }}
-        """
-
     def _create_data_input_section(self):
         """Create the data input section."""
         group = QGroupBox("📁 Data Input")
@@ -244,10 +411,10 @@ class SidebarPanel(QWidget):
 
         # File info label
         self.las_info_label = QLabel("")
+        self.las_info_label.setObjectName("lasInfoLabel")
+        # Initial state, so that reset_ui does not repolish an untouched label
+        self.las_info_label.setProperty("state", "")
         self.las_info_label.setWordWrap(True)
-        self.las_info_label.setStyleSheet(
-            f"color: {get_color('text_secondary')}; background-color: transparent;"
-        )
         layout.addWidget(self.las_info_label)
 
         # Merge controls (hidden by default)
@@ -274,9 +441,7 @@ class SidebarPanel(QWidget):
         merge_layout.addLayout(settings_layout)
 
         self.merge_btn = QPushButton("🔄 Merge LAS Files")
-        self.merge_btn.setStyleSheet(
-            f"background-color: {get_color('success')}; color: white;"
-        )
+        self.merge_btn.setObjectName("mergeButton")
         self.merge_btn.clicked.connect(self.merge_requested.emit)
         merge_layout.addWidget(self.merge_btn)
 
@@ -300,7 +465,7 @@ class SidebarPanel(QWidget):
         layout.addWidget(self.tops_btn)
 
         self.tops_info_label = QLabel("")
-        self.tops_info_label.setStyleSheet("color: green;")
+        self.tops_info_label.setObjectName("fileInfoLabel")
         layout.addWidget(self.tops_info_label)
 
         self.content_layout.addWidget(group)
@@ -330,13 +495,15 @@ class SidebarPanel(QWidget):
         layout.addLayout(settings)
 
         self.core_info_label = QLabel("")
-        self.core_info_label.setStyleSheet("color: green;")
+        self.core_info_label.setObjectName("fileInfoLabel")
         layout.addWidget(self.core_info_label)
 
         self.content_layout.addWidget(group)
 
     def _create_parameters_section(self):
         """Create reorganized parameter groups for better UX."""
+        # Lay the groups out once, after all of them have been added
+        self.params_frame.setUpdatesEnabled(False)
 
         # =========================================================
         # 📊 ANALYSIS SETTINGS (Always expanded)
@@ -398,6 +565,110 @@ class SidebarPanel(QWidget):
 
         # --- Rock Properties (Nested Collapsible) ---
         rock_group = CollapsibleGroupBox("🪨 Rock Properties", expanded=False)
+        self._defer_section(
+            rock_group,
+            self._create_rock_params,
+            ("matrix_params_widget", "fluid_params_widget", "shale_params_widget"),
+        )
+        advanced_layout.addWidget(rock_group)
+
+        # --- Saturation Models (Nested Collapsible) ---
+        sat_group = CollapsibleGroupBox("💧 Saturation Models", expanded=False)
+        self._defer_section(
+            sat_group,
+            self._create_saturation_params,
+            ("archie_params_widget", "sw_models_widget", "res_params_widget"),
+        )
+        advanced_layout.addWidget(sat_group)
+
+        # Keep reference for backward compatibility
+        self.sw_models_group = sat_group
+
+        # --- Permeability (Nested Collapsible) ---
+        perm_group = CollapsibleGroupBox("📈 Permeability", expanded=False)
+        self._defer_section(
+            perm_group,
+            self._create_perm_params,
+            ("perm_params_widget", "swir_params_widget"),
+        )
+        advanced_layout.addWidget(perm_group)
+
+        advanced_section.set_content_widget(advanced_container)
+        self.params_layout.addWidget(advanced_section)
+
+        # =========================================================
+        # ⚡ CORRECTIONS (Collapsed)
+        # =========================================================
+        corrections_section = CollapsibleGroupBox("⚡ Corrections", expanded=False)
+        self._defer_section(
+            corrections_section,
+            self._create_corrections_params,
+            ("gas_correction_widget",),
+        )
+        self.params_layout.addWidget(corrections_section)
+
+        self.params_frame.setUpdatesEnabled(True)
+        self.params_frame.updateGeometry()
+
+    def _ensure_parameters_section(self):
+        """
+        Build the parameters section the first time data is shown.
+
+        A failed build is undone, so the next data load tries again.
+        """
+        if self.is_built("analysis_mode_widget"):
+            return
+        try:
+            self._create_parameters_section()
+        except Exception:
+            self._discard_parameters_section()
+            raise
+
+        # Collapsed sections registered their own widgets as lazy
+        built = [name for name in _PARAM_SIGNALS if name not in self._lazy_sections]
+        for widget_name in built:
+            self._register_params_widget(widget_name)
+        for widget_name in built:
+            self.params_widget_created.emit(widget_name)
+
+        # Formation tops may have been loaded before the first LAS file
+        tops = self.model.formation_tops
+        if tops is not None:
+            self.analysis_mode_widget.set_formations(tops.get_formation_list())
+
+    def _discard_parameters_section(self):
+        """Remove a partly built parameters section."""
+        while (item := self.params_layout.takeAt(0)) is not None:
+            if (widget := item.widget()) is not None:
+                widget.deleteLater()
+        for widget_name in _PARAMS_SECTION_WIDGETS:
+            self.__dict__.pop(widget_name, None)
+            self._lazy_sections.pop(widget_name, None)
+        self.params_frame.setUpdatesEnabled(True)
+
+    def _defer_section(self, section, factory, widget_names):
+        """Let a collapsed section build its parameter widgets on first expand."""
+        for widget_name in widget_names:
+            self._lazy_sections[widget_name] = section.ensure_content
+
+        def build():
+            try:
+                content = factory()
+            except Exception:
+                # Drop half-built widgets, so a retry starts from scratch
+                for widget_name in widget_names:
+                    self.__dict__.pop(widget_name, None)
+                raise
+            for widget_name in widget_names:
+                self._register_params_widget(widget_name)
+            for widget_name in widget_names:
+                self.params_widget_created.emit(widget_name)
+            return content
+
+        section.set_content_factory(build)
+
+    def _create_rock_params(self) -> QWidget:
+        """Build the Rock Properties content."""
         rock_container = QWidget()
         rock_layout = QVBoxLayout(rock_container)
         rock_layout.setContentsMargins(0, 0, 0, 0)
@@ -417,12 +688,10 @@ class SidebarPanel(QWidget):
         rock_layout.addWidget(self.fluid_params_widget)
         rock_layout.addWidget(self._create_mini_label("Shale:"))
         rock_layout.addWidget(self.shale_params_widget)
+        return rock_container
 
-        rock_group.set_content_widget(rock_container)
-        advanced_layout.addWidget(rock_group)
-
-        # --- Saturation Models (Nested Collapsible) ---
-        sat_group = CollapsibleGroupBox("💧 Saturation Models", expanded=False)
+    def _create_saturation_params(self) -> QWidget:
+        """Build the Saturation Models content."""
         sat_container = QWidget()
         sat_layout = QVBoxLayout(sat_container)
         sat_layout.setContentsMargins(0, 0, 0, 0)
@@ -444,15 +713,10 @@ class SidebarPanel(QWidget):
         sat_layout.addWidget(self.sw_models_widget)
         sat_layout.addWidget(self._create_mini_label("Resistivity:"))
         sat_layout.addWidget(self.res_params_widget)
+        return sat_container
 
-        sat_group.set_content_widget(sat_container)
-        advanced_layout.addWidget(sat_group)
-
-        # Keep reference for backward compatibility
-        self.sw_models_group = sat_group
-
-        # --- Permeability (Nested Collapsible) ---
-        perm_group = CollapsibleGroupBox("📈 Permeability", expanded=False)
+    def _create_perm_params(self) -> QWidget:
+        """Build the Permeability content."""
         perm_container = QWidget()
         perm_layout = QVBoxLayout(perm_container)
         perm_layout.setContentsMargins(0, 0, 0, 0)
@@ -469,135 +733,196 @@ class SidebarPanel(QWidget):
         perm_layout.addWidget(self.perm_params_widget)
         perm_layout.addWidget(self._create_mini_label("Swirr Estimation:"))
         perm_layout.addWidget(self.swir_params_widget)
+        return perm_container
 
-        perm_group.set_content_widget(perm_container)
-        advanced_layout.addWidget(perm_group)
-
-        advanced_section.set_content_widget(advanced_container)
-        self.params_layout.addWidget(advanced_section)
-
-        # =========================================================
-        # ⚡ CORRECTIONS (Collapsed)
-        # =========================================================
-        corrections_section = CollapsibleGroupBox("⚡ Corrections", expanded=False)
+    def _create_corrections_params(self) -> QWidget:
+        """Build the Corrections content."""
         corrections_container = QWidget()
         corrections_layout = QVBoxLayout(corrections_container)
         corrections_layout.setContentsMargins(0, 0, 0, 0)
 
         self.gas_correction_widget = GasCorrectionGroup()
         corrections_layout.addWidget(self.gas_correction_widget)
+        return corrections_container
 
-        corrections_section.set_content_widget(corrections_container)
-        self.params_layout.addWidget(corrections_section)
+    def ensure_widget(self, widget_name: str) -> QWidget:
+        """
+        Return a parameter widget, building its collapsed section first if
+        needed.
+
+        Raises AttributeError if the widget is not built, e.g. because no
+        data has been loaded yet.
+        """
+        build = self._lazy_sections.get(widget_name)
+        if build is not None:
+            build()
+        if not self.is_built(widget_name):
+            raise AttributeError(f"Sidebar widget {widget_name!r} was not built")
+        return self.__dict__[widget_name]
+
+    def is_built(self, widget_name: str) -> bool:
+        """Whether a sidebar widget exists yet, without building it."""
+        return widget_name in self.__dict__
 
     def _create_subsection_label(self, text: str) -> QLabel:
-        """Create a styled subsection label."""
+        """Create a subsection label, styled by the application stylesheet."""
         label = QLabel(text)
-        label.setStyleSheet(f"""
-            font-weight: 600;
-            color: {get_color("text_secondary")};
-            padding: 4px 0px 2px 0px;
-            border-bottom: 1px solid {get_color("border_light")};
-            margin-top: 8px;
-            background: transparent;
-        """)
-
+        label.setObjectName("subsectionLabel")
         return label
 
     def _create_mini_label(self, text: str) -> QLabel:
         """Create a mini label for nested parameters."""
         label = QLabel(text)
-        label.setStyleSheet(
-            f"""
-            font-weight: 500;
-            font-size: 11px;
-            color: {get_color("text_secondary")};
-            background: transparent;
-        """
-        )
+        label.setObjectName("miniLabel")
         return label
 
-    def _connect_signals(self):
-        """Connect internal signals."""
-        # Parameter changes
-        self.curve_mapping_widget.mapping_changed.connect(self._on_params_changed)
-        self.analysis_mode_widget.mode_changed.connect(self._on_params_changed)
-        self.vsh_params_widget.params_changed.connect(self._on_params_changed)
-        self.porosity_method_widget.params_changed.connect(self._on_params_changed)
-        self.matrix_params_widget.params_changed.connect(self._on_params_changed)
-        self.fluid_params_widget.params_changed.connect(self._on_params_changed)
-        self.shale_params_widget.params_changed.connect(self._on_params_changed)
-        self.archie_params_widget.params_changed.connect(self._on_params_changed)
-        self.sw_models_widget.params_changed.connect(self._on_params_changed)
-        self.res_params_widget.params_changed.connect(self._on_params_changed)
-        self.perm_params_widget.params_changed.connect(self._on_params_changed)
-        self.swir_params_widget.params_changed.connect(self._on_params_changed)
-        self.cutoff_params_widget.params_changed.connect(self._on_params_changed)
-        self.gas_correction_widget.params_changed.connect(self._on_params_changed)
-
-    def _on_params_changed(self, *args):
-        """Handle parameter changes."""
-        self.update_model_from_ui()
-        self.parameters_updated.emit()
+    def _register_params_widget(self, widget_name: str):
+        """Hook a built parameter widget up to the debounce and model copy."""
+        self._lazy_sections.pop(widget_name, None)
+        widget = getattr(self, widget_name)
+        # Emitted on the UI thread, so call the slot directly
+        getattr(widget, _PARAM_SIGNALS[widget_name]).connect(
+            self._on_params_changed, Qt.ConnectionType.DirectConnection
+        )
+        # Typed numbers change the value once, on Enter or focus out, not on
+        # every keystroke; arrow steps still apply immediately
+        for spin in widget.findChildren(QAbstractSpinBox):
+            spin.setKeyboardTracking(False)
+        fields = _GROUP_FIELDS_BY_WIDGET.get(widget_name)
+        if fields is not None:
+            self._group_readers.append((widget.get_params, fields))
+        self._bind_control_readers(widget_name)
+
+    def _bind_control_readers(self, widget_name: str):
+        """Bind the _CONTROL_FIELDS getters of a built widget."""
+        for attr, name, getter in _CONTROL_FIELDS:
+            if name == widget_name:
+                widget = getattr(self, widget_name)
+                self._control_readers.append((attr, getattr(widget, getter)))
+
+    @pyqtSlot()
+    def _on_params_changed(self):
+        """Handle parameter changes (debounced)."""
+        self._param_debounce.start()
+
+    def flush_parameters(self):
+        """
+        Copy the edited parameters into the model now.
+
+        Cancels a pending debounce, so a burst of edits followed by an
+        action is read once.
+        """
+        self._param_debounce.stop()
+        if self.update_model_from_ui():
+            self.parameters_updated.emit()
+
+    def _ask_open_paths(self, kind: str):
+        """
+        Show the open-file dialog for kind, starting in the last used directory.
+
+        Returns the selected paths (empty if cancelled). Each kind keeps one
+        dialog, so its construction cost is only paid on the first open.
+        """
+        dialog = self._open_dialogs.get(kind)
+        if dialog is None:
+            title, name_filters, multiple = _OPEN_DIALOGS[kind]
+            dialog = QFileDialog(self, title)
+            dialog.setOptions(_OPEN_OPTIONS)
+            dialog.setNameFilters(name_filters)
+            dialog.setFileMode(
+                QFileDialog.FileMode.ExistingFiles
+                if multiple
+                else QFileDialog.FileMode.ExistingFile
+            )
+            self._open_dialogs[kind] = dialog
+
+        if self.model.last_open_dir:
+            dialog.setDirectory(self.model.last_open_dir)
+
+        paths = dialog.selectedFiles() if dialog.exec() else []
+        if paths:
+            self.model.last_open_dir = os.path.dirname(paths[0])
+        return paths
 
     def _on_open_las(self):
         """Open LAS file dialog."""
-        files, _ = QFileDialog.getOpenFileNames(
-            self, "Open LAS File(s)", "", "LAS Files (*.las *.LAS);;All Files (*)"
-        )
+        files = self._ask_open_paths("las")
         if files:
             self.las_files_selected.emit(files)
 
     def _on_open_tops(self):
         """Open formation tops file dialog."""
-        file, _ = QFileDialog.getOpenFileName(
-            self, "Open Formation Tops", "", "Text Files (*.txt *.csv);;All Files (*)"
-        )
-        if file:
-            self.tops_file_selected.emit(file)
+        files = self._ask_open_paths("tops")
+        if files:
+            self.tops_file_selected.emit(files[0])
 
     def _on_open_core(self):
         """Open core data file dialog."""
-        file, _ = QFileDialog.getOpenFileName(
-            self, "Open Core Data", "", "Text Files (*.txt *.csv);;All Files (*)"
-        )
-        if file:
-            self.core_file_selected.emit(file)
+        files = self._ask_open_paths("core")
+        if files:
+            self.core_file_selected.emit(files[0])
 
     # =========================================================================
     # PUBLIC METHODS
     # =========================================================================
 
-    def update_las_info(
-        self, filename: str, rows: int, curves: int, is_merged: bool = False
-    ):
-        """Update LAS file info display."""
+    def update_las_info(self, entry, rows: int, curves: int, is_merged: bool = False):
+        """
+        Update LAS file info display.
+
+        entry is the loaded file's LasFileEntry (None for merged data).
+        """
+        self._is_reset = False
         if is_merged:
-            self.las_info_label.setText(f"✅ Merged: {rows:,} rows, {curves} curves")
-            self.las_info_label.setStyleSheet(f"color: {get_color('success')};")
+            self._set_las_info(f"✅ Merged: {rows:,} rows, {curves} curves", "loaded")
             self.download_merged_btn.setVisible(True)
         else:
-            self.las_info_label.setText(
-                f"✅ Loaded: {os.path.basename(filename)}\n📊 {rows:,} rows, {curves} curves"
+            self._set_las_info(
+                f"✅ Loaded: {entry.basename}\n📊 {rows:,} rows, {curves} curves",
+                "loaded",
             )
-            self.las_info_label.setStyleSheet(f"color: {get_color('success')};")
 
         # Show parameters section
+        self._ensure_parameters_section()
         self.params_frame.setVisible(True)
         self.run_btn.setEnabled(True)
 
-    def update_multiple_files_info(self, count: int):
+    def show_files_metadata(self, count: int, total_bytes: int):
+        """Show the size of the selected files while they are being read."""
+        self._is_reset = False
+        self._set_las_info(
+            f"📁 {count} files selected ({_format_size(total_bytes)})", "files"
+        )
+
+    def update_multiple_files_info(self, count: int, total_bytes: int = None):
         """Show multiple files selected info."""
-        self.las_info_label.setText(f"📁 {count} files selected")
-        self.las_info_label.setStyleSheet(f"color: {get_color('primary')};")
+        self._is_reset = False
+        text = f"📁 {count} files selected"
+        if total_bytes:
+            text += f" ({_format_size(total_bytes)})"
+        self._set_las_info(text, "files")
         self.merge_frame.setVisible(True)
+        # Built ahead of the merge; shown once the merged data is loaded
+        self._ensure_parameters_section()
+
+    def _set_las_info(self, text: str, state: str = ""):
+        """Set the LAS info text; the theme stylesheet colors it by state."""
+        label = self.las_info_label
+        label.setText(text)
+        if label.property("state") != state:
+            label.setProperty("state", state)
+            # Property selectors are only re-evaluated on repolish
+            label.style().unpolish(label)
+            label.style().polish(label)
 
     def update_tops_info(self, count: int):
         """Update formation tops info."""
+        self._is_reset = False
         self.tops_info_label.setText(f"✅ Loaded {count} formations")
 
     def update_core_info(self, count: int, unit: str, por_converted: bool = False):
         """Update core data info."""
+        self._is_reset = False
         msg = f"✅ Loaded {count} samples ({unit})"
         if por_converted:
             msg += "\nℹ️ Porosity auto-converted % → fraction"
@@ -605,19 +930,25 @@ class SidebarPanel(QWidget):
 
     def update_available_curves(self, curves: list, detected: dict = None):
         """Update curve mapping combos."""
-        self.curve_mapping_widget.set_available_curves(curves, detected)
+        self._is_reset = False
+        if self.is_built("curve_mapping_widget"):
+            self.curve_mapping_widget.set_available_curves(curves, detected)
 
     def update_formations_list(self, formations: list):
         """Update formation list in analysis mode widget."""
-        self.analysis_mode_widget.set_formations(formations)
+        self._is_reset = False
+        # Before the first data load the list is picked up from the model
+        # when the parameters section is built
+        if self.is_built("analysis_mode_widget"):
+            self.analysis_mode_widget.set_formations(formations)
 
     def show_calculated_rw_rsh(self, rw: float, rsh: float):
         """Show calculated Rw/Rsh values."""
-        self.res_params_widget.show_calculated_result(rw, rsh)
+        self.ensure_widget("res_params_widget").show_calculated_result(rw, rsh)
 
     def show_calculated_shale(self, result: dict):
         """Show calculated shale parameters."""
-        self.shale_params_widget.show_calculated_result(result)
+        self.ensure_widget("shale_params_widget").show_calculated_result(result)
 
     def _apply_perm_values(self):
         """Apply calculated permeability coefficients."""
@@ -625,148 +956,111 @@ class SidebarPanel(QWidget):
 
     def set_progress(self, value: int, message: str = None):
         """Set progress bar value."""
+        self._is_reset = False
         self.progress_bar.setVisible(value < 100)
         self.progress_bar.setValue(value)
         if message:
             self.progress_bar.setFormat(f"{message} - %p%")
 
-    def update_model_from_ui(self):
-        """Update model from UI values."""
-        # Analysis mode
-        self.model.analysis_mode = self.analysis_mode_widget.get_mode()
-        self.model.selected_formations = (
-            self.analysis_mode_widget.get_selected_formations()
-        )
+    def set_las_loading(self, loading: bool, message: str = ""):
+        """
+        Show or clear the busy state while LAS files are parsed in the background.
 
-        # Curve mapping
-        for ctype, curve in self.curve_mapping_widget.get_mapping().items():
-            self.model.set_curve_mapping(ctype, curve)
-
-        # VShale params
-        vsh = self.vsh_params_widget.get_params()
-        self.model.vsh_baseline_method = vsh["baseline_method"]
-        self.model.gr_min_manual = vsh["gr_min"]
-        self.model.gr_max_manual = vsh["gr_max"]
-        self.model.vsh_methods = vsh["methods"]
-
-        # Porosity method
-        porosity = self.porosity_method_widget.get_params()
-        self.model.primary_phie_method = porosity["primary_phie_method"]
-
-        # Matrix params
-        matrix = self.matrix_params_widget.get_params()
-        self.model.rho_matrix = matrix["rho_matrix"]
-        self.model.dt_matrix = matrix["dt_matrix"]
-
-        # Fluid params
-        fluid = self.fluid_params_widget.get_params()
-        self.model.rho_fluid = fluid["rho_fluid"]
-        self.model.dt_fluid = fluid["dt_fluid"]
-
-        # Shale params
-        shale = self.shale_params_widget.get_params()
-        self.model.shale_approach = shale["approach"]
-        self.model.rho_shale = shale["rho_shale"]
-        self.model.dt_shale = shale["dt_shale"]
-        self.model.nphi_shale = shale["nphi_shale"]
-        # Shale estimation settings (v2.0)
-        self.model.shale_vsh_threshold = shale.get("shale_vsh_threshold", 0.80)
-        self.model.shale_gate_logs = shale.get("shale_gate_logs", True)
-        self.model.shale_iqr_filter = shale.get("shale_iqr_filter", True)
-        # Adaptive shale threshold params (v2.1)
-        self.model.shale_selection_mode = shale.get(
-            "shale_selection_mode", "fixed_threshold"
-        )
-        self.model.shale_vsh_quantile = shale.get("shale_vsh_quantile", 0.90)
-        self.model.shale_min_points = shale.get("shale_min_points", 50)
-        self.model.shale_sweep_tmin = shale.get("shale_sweep_tmin", 0.65)
-        self.model.shale_sweep_tmax = shale.get("shale_sweep_tmax", 0.95)
-        self.model.shale_sweep_step = shale.get("shale_sweep_step", 0.02)
-
-        # Archie params
-        archie_cfg = self.archie_params_widget.get_params()
-        self.model.lithology_preset = archie_cfg["lithology"]
-        self.model.a = archie_cfg["a"]
-        self.model.m = archie_cfg["m"]
-        self.model.n = archie_cfg["n"]
-
-        # Sw Models
-        sw_cfg = self.sw_models_widget.get_params()
-        self.model.sw_methods = sw_cfg["sw_methods"]
-        self.model.sw_primary_method = sw_cfg["sw_primary_method"]
-        self.model.ws_qv = sw_cfg["ws_qv"]
-        self.model.ws_b = sw_cfg["ws_b"]
-        self.model.dw_swb = sw_cfg["dw_swb"]
-        self.model.dw_rwb = sw_cfg["dw_rwb"]
-
-        # Resistivity params
-        res_cfg = self.res_params_widget.get_params()
-        self.model.rw = res_cfg["rw"]
-        self.model.rsh = res_cfg["rsh"]
-
-        # Perm params
-        perm = self.perm_params_widget.get_params()
-        self.model.perm_C = perm["C"]
-        self.model.perm_P = perm["P"]
-        self.model.perm_Q = perm["Q"]
-
-        # Swirr params
-        swir = self.swir_params_widget.get_params()
-        self.model.swirr_method = swir["method"]
-        self.model.buckles_preset = swir["buckles_preset"]
-        self.model.k_buckles = swir["k_buckles"]
-
-        # Cutoff params
-        cutoff = self.cutoff_params_widget.get_params()
-        self.model.vsh_cutoff = cutoff["vsh_cutoff"]
-        self.model.phi_cutoff = cutoff["phi_cutoff"]
-        self.model.sw_cutoff = cutoff["sw_cutoff"]
+        The open button is disabled so a second load cannot be started
+        meanwhile; the progress bar runs in indeterminate mode.
+        """
+        self.las_btn.setEnabled(not loading)
+        self.set_busy(loading, message)
+
+    def set_busy(self, busy: bool, message: str = ""):
+        """Show an indeterminate progress bar while background work runs."""
+        self._is_reset = False
+        if busy:
+            self.progress_bar.setRange(0, 0)
+            self.progress_bar.setFormat(message)
+            self.progress_bar.setVisible(True)
+        else:
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setVisible(False)
 
-        # Merge settings
-        self.model.merge_step = self.merge_step_spin.value()
-        self.model.merge_gap_limit = self.merge_gap_spin.value()
+    def update_model_from_ui(self) -> bool:
+        """
+        Update model from UI values.
 
-        # Core settings
-        self.model.core_depth_unit = self.core_unit_combo.currentText()
-        self.model.core_max_dist = self.core_dist_spin.value()
+        Only fields whose UI value differs from the model are written.
+        Returns True if any field changed.
+        """
+        model = self.model
+        changed = False
+
+        # Parameter groups; the model, not a cached UI snapshot, is the
+        # reference because sessions and estimates also write to it
+        for get_params, fields in self._group_readers:
+            params = get_params()
+            for attr, key in fields:
+                value = params[key]
+                if getattr(model, attr) != value:
+                    setattr(model, attr, value)
+                    changed = True
+
+        # Single-value controls
+        for attr, read in self._control_readers:
+            value = read()
+            if getattr(model, attr) != value:
+                setattr(model, attr, value)
+                changed = True
+
+        # Curve mapping
+        if self.is_built("curve_mapping_widget"):
+            mapping = model.curve_mapping
+            for ctype, curve in self.curve_mapping_widget.get_mapping().items():
+                if mapping.get(ctype) != curve:
+                    model.set_curve_mapping(ctype, curve)
+                    changed = True
 
-        # Gas correction (v1.2)
-        gas = self.gas_correction_widget.get_params()
-        self.model.gas_correction_enabled = gas["enabled"]
-        self.model.gas_nphi_factor = gas["nphi_factor"]
-        self.model.gas_rhob_factor = gas["rhob_factor"]
+        return changed
 
     def reset_ui(self):
         """Reset sidebar UI to fresh/initial state."""
-        # Reset LAS info
-        self.las_info_label.setText("")
-        self.las_info_label.setStyleSheet(
-            f"color: {get_color('text_secondary')}; background-color: transparent;"
-        )
-
-        # Hide merge controls
-        self.merge_frame.setVisible(False)
-        self.download_merged_btn.setVisible(False)
-
-        # Reset formation tops info
-        self.tops_info_label.setText("")
-
-        # Reset core data info
-        self.core_info_label.setText("")
-
-        # Hide parameters section and disable run button
-        self.params_frame.setVisible(False)
-        self.run_btn.setEnabled(False)
-
-        # Hide progress bar
-        self.progress_bar.setVisible(False)
-        self.progress_bar.setValue(0)
-
-        # Clear curve mapping
-        self.curve_mapping_widget.set_available_curves([], None)
-
-        # Clear formations list
-        self.analysis_mode_widget.set_formations([])
+        if self._is_reset:
+            return
+
+        # Repaint once after all the changes below
+        self.setUpdatesEnabled(False)
+        try:
+            # Reset LAS info
+            self._set_las_info("")
+
+            # Hide merge controls
+            self.merge_frame.setVisible(False)
+            self.download_merged_btn.setVisible(False)
+
+            # Reset formation tops info
+            self.tops_info_label.setText("")
+
+            # Reset core data info
+            self.core_info_label.setText("")
+
+            # Hide parameters section and disable run button
+            self.params_frame.setVisible(False)
+            self.run_btn.setEnabled(False)
+
+            # Clear any loading state and hide progress bar
+            self.las_btn.setEnabled(True)
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setVisible(False)
+            self.progress_bar.setValue(0)
+
+            # Clear curve mapping and formations; the model was reset
+            # already, so the emptied widgets must not be copied back into it
+            if self.is_built("analysis_mode_widget"):
+                with QSignalBlocker(self.curve_mapping_widget):
+                    self.curve_mapping_widget.set_available_curves([], None)
+                with QSignalBlocker(self.analysis_mode_widget):
+                    self.analysis_mode_widget.set_formations([])
+        finally:
+            self.setUpdatesEnabled(True)
+        self._is_reset = True
 
     def _on_theme_toggle(self):
         """Handle theme toggle button click."""
@@ -774,40 +1068,5 @@ class SidebarPanel(QWidget):
 
     def update_theme_button(self, is_dark: bool):
         """Update theme button icon based on current theme."""
-        if is_dark:
-            self.theme_btn.setText("☀️")  # Show sun = click to go light
-            self.theme_btn.setToolTip("Switch to Light Theme")
-        else:
-            self.theme_btn.setText("🌙")  # Show moon = click to go dark
-            self.theme_btn.setToolTip("Switch to Dark Theme")
-
-    def _apply_help_style(self):
-        self.help_btn.setStyleSheet(
-            f"text-align: left; padding: 5px; color: {get_color('text_secondary')};"
-        )
-
-    def refresh_theme(self):
-        """Refresh widget styling when theme changes."""
-        # Refresh toolbar buttons
-        for btn in [
-            self.new_btn,
-            self.save_session_btn,
-            self.load_session_btn,
-            self.theme_btn,
-        ]:
-            self._apply_toolbar_style(btn)
-
-        # Refresh collapsible groups
-        for group in self.findChildren(CollapsibleGroupBox):
-            if hasattr(group, "refresh_theme"):
-                group.refresh_theme()
-
-        # Refresh Run Analysis button
-        self.run_btn.setStyleSheet(self._get_run_button_style())
-
-        # Refresh info labels/help color
-        self.las_info_label.setStyleSheet(
-            f"color: {get_color('text_secondary')}; background-color: transparent;"
-        )
-        if hasattr(self, "help_btn"):
-            self._apply_help_style()
+        self.theme_btn.setIcon(self._theme_icons[is_dark])
+        self.theme_btn.setToolTip(_THEME_BUTTON_STATES[is_dark][1])
@@ -1,9 +1,30 @@
 # Tabs package
-from .qc_tab import QCTab
-from .petrophysics_tab import PetrophysicsTab
-from .log_display_tab import LogDisplayTab
-from .diagnostics_tab import DiagnosticsTab
-from .summary_tab import SummaryTab
-from .export_tab import ExportTab
-
-__all__ = ['QCTab', 'PetrophysicsTab', 'LogDisplayTab', 'DiagnosticsTab', 'SummaryTab', 'ExportTab']
+import importlib
+from types import MappingProxyType
+
+# Tab classes are imported from their modules on first access, so importing
+# one tab module does not pull in all the others
+_LAZY = MappingProxyType({
+    'QCTab': '.qc_tab',
+    'PetrophysicsTab': '.petrophysics_tab',
+    'LogDisplayTab': '.log_display_tab',
+    'DiagnosticsTab': '.diagnostics_tab',
+    'SummaryTab': '.summary_tab',
+    'ExportTab': '.export_tab',
+})
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -25,6 +25,14 @@ from ..widgets.plot_widget import HistogramPlot, CrossPlot, PlotWidget
 from themes.colors import get_color
 
 
+def _set_warning(label: QLabel, text: str, style: str):
+    """Show a warning text; the stylesheet is only re-applied when it changes."""
+    label.setText(text)
+    # setStyleSheet re-polishes the label even when the sheet is identical
+    if label.styleSheet() != style:
+        label.setStyleSheet(style)
+
+
 class DiagnosticsTab(QWidget):
     """Diagnostics Tab - cross-validation, statistics, and warnings."""
 
@@ -351,16 +359,21 @@ class DiagnosticsTab(QWidget):
                 has_high_dev = True
 
             if has_high_dev:
-                self.shale_warnings.setText("⚠️ High deviation in shale parameters")
-                self.shale_warnings.setStyleSheet("color: orange; font-weight: bold;")
+                _set_warning(
+                    self.shale_warnings,
+                    "⚠️ High deviation in shale parameters",
+                    "color: orange; font-weight: bold;",
+                )
             else:
-                self.shale_warnings.setText("✅ Shale parameters within expected range")
-                self.shale_warnings.setStyleSheet("color: green;")
+                _set_warning(
+                    self.shale_warnings,
+                    "✅ Shale parameters within expected range",
+                    "color: green;",
+                )
         else:
             self.shale_stat_label.setText("(No shale stats available)")
             self.shale_dev_label.setText("-")
-            self.shale_warnings.setText("✅ Shale parameters set")
-            self.shale_warnings.setStyleSheet("color: green;")
+            _set_warning(self.shale_warnings, "✅ Shale parameters set", "color: green;")
 
         # =====================================================================
         # POROSITY VALIDATION
@@ -537,11 +550,13 @@ class DiagnosticsTab(QWidget):
                     warnings.append(f"⚠️ {col}: {low_k} points with k < 0.001 mD")
 
             if warnings:
-                self.perm_warnings.setText("\n".join(warnings))
-                self.perm_warnings.setStyleSheet("color: orange;")
+                _set_warning(self.perm_warnings, "\n".join(warnings), "color: orange;")
             else:
-                self.perm_warnings.setText("✅ No permeability outliers detected")
-                self.perm_warnings.setStyleSheet("color: green;")
+                _set_warning(
+                    self.perm_warnings,
+                    "✅ No permeability outliers detected",
+                    "color: green;",
+                )
 
         # =====================================================================
         # NET PAY VALIDATION
@@ -565,11 +580,13 @@ class DiagnosticsTab(QWidget):
                 warnings.append(f"⚠️ N/G Pay ({ng_pay:.1f}%) > 50% - verify cutoffs")
 
             if warnings:
-                self.pay_warnings.setText("\n".join(warnings))
-                self.pay_warnings.setStyleSheet("color: orange;")
+                _set_warning(self.pay_warnings, "\n".join(warnings), "color: orange;")
             else:
-                self.pay_warnings.setText("✅ Net Pay values within expected range")
-                self.pay_warnings.setStyleSheet("color: green;")
+                _set_warning(
+                    self.pay_warnings,
+                    "✅ Net Pay values within expected range",
+                    "color: green;",
+                )
 
         # =====================================================================
         # CORE DATA VALIDATION
@@ -722,13 +739,17 @@ class DiagnosticsTab(QWidget):
                     warnings.append(f"⚠️ Porosity bias = {por_result.bias:.3f} (>0.05)")
 
                 if warnings:
-                    self.core_warnings.setText("\n".join(warnings))
-                    self.core_warnings.setStyleSheet("color: orange;")
+                    _set_warning(
+                        self.core_warnings,
+                        "\n".join(warnings),
+                        "color: orange;",
+                    )
                 else:
-                    self.core_warnings.setText(
-                        "✅ Core validation within acceptable range"
+                    _set_warning(
+                        self.core_warnings,
+                        "✅ Core validation within acceptable range",
+                        "color: green;",
                     )
-                    self.core_warnings.setStyleSheet("color: green;")
         else:
             self.core_group.setVisible(False)
 
@@ -834,14 +855,20 @@ class DiagnosticsTab(QWidget):
 
         # Check if selected method exists in results
         if selected_method not in results.columns:
-            self.phie_warnings.setText(f"⚠️ {selected_method} not available in results")
-            self.phie_warnings.setStyleSheet("color: orange;")
+            _set_warning(
+                self.phie_warnings,
+                f"⚠️ {selected_method} not available in results",
+                "color: orange;",
+            )
             return
 
         data = results[selected_method].dropna()
         if len(data) == 0:
-            self.phie_warnings.setText(f"⚠️ {selected_method} has no valid data")
-            self.phie_warnings.setStyleSheet("color: orange;")
+            _set_warning(
+                self.phie_warnings,
+                f"⚠️ {selected_method} has no valid data",
+                "color: orange;",
+            )
             return
 
         # Update histogram
@@ -883,11 +910,13 @@ class DiagnosticsTab(QWidget):
             )
 
         if warnings:
-            self.phie_warnings.setText("\n".join(warnings))
-            self.phie_warnings.setStyleSheet("color: orange;")
+            _set_warning(self.phie_warnings, "\n".join(warnings), "color: orange;")
         else:
-            self.phie_warnings.setText(f"✅ No {selected_method} outliers detected")
-            self.phie_warnings.setStyleSheet("color: green;")
+            _set_warning(
+                self.phie_warnings,
+                f"✅ No {selected_method} outliers detected",
+                "color: green;",
+            )
 
     def reset_ui(self):
         """Reset UI to fresh state for New Project."""
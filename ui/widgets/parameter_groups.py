@@ -25,8 +25,16 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve
-from typing import List, Dict, Optional
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QPropertyAnimation,
+    QEasingCurve,
+    QSignalBlocker,
+)
+from typing import Callable, List, Dict, Optional
+
+from themes.colors import get_color
 
 
 class CollapsibleGroupBox(QWidget):
@@ -44,6 +52,8 @@ class CollapsibleGroupBox(QWidget):
         self._title = title
         self._content_widget = None
         self._content_height = 0
+        # Deferred content builder, called on first expand
+        self._factory = None
 
         self._setup_ui()
 
@@ -62,11 +72,12 @@ class CollapsibleGroupBox(QWidget):
 
         # Toggle indicator
         self.toggle_icon = QLabel("▼" if self._is_expanded else "▶")
+        self.toggle_icon.setObjectName("collapsibleToggle")
         self.toggle_icon.setFixedWidth(16)
 
         # Title
         self.title_label = QLabel(self._title)
-        self.title_label.setStyleSheet("font-weight: bold; background: transparent;")
+        self.title_label.setObjectName("collapsibleTitle")
 
         header_layout.addWidget(self.toggle_icon)
         header_layout.addWidget(self.title_label)
@@ -91,50 +102,11 @@ class CollapsibleGroupBox(QWidget):
         self.animation.setDuration(self._animation_duration)
         self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
 
-        # Apply theme-aware styles
-        self._apply_theme_styles()
-
         # Initial state
         if not self._is_expanded:
             self.content_container.setMaximumHeight(0)
             self.content_container.setVisible(False)
 
-    def _apply_theme_styles(self):
-        """Apply current theme colors to widget."""
-        from themes.colors import get_color
-
-        header_bg = get_color("collapsible_header")
-        header_hover = get_color("collapsible_header_hover")
-        content_bg = get_color("collapsible_content")
-        border = get_color("collapsible_border")
-        toggle_color = get_color("collapsible_toggle")
-
-        self.header.setStyleSheet(f"""
-            #collapsibleHeader {{
-                background-color: {header_bg};
-                border: 1px solid {border};
-                border-radius: 4px;
-                padding: 6px 8px;
-            }}
-            #collapsibleHeader:hover {{
-                background-color: {header_hover};
-            }}
-        """)
-
-        self.content_container.setStyleSheet(f"""
-            #collapsibleContent {{
-                border: 1px solid {border};
-                border-top: none;
-                border-bottom-left-radius: 4px;
-                border-bottom-right-radius: 4px;
-                background-color: {content_bg};
-            }}
-        """)
-
-        self.toggle_icon.setStyleSheet(
-            f"font-size: 10px; color: {toggle_color}; background: transparent;"
-        )
-
     def set_content_widget(self, widget: QWidget):
         """Set the content widget inside the collapsible area."""
         self._content_widget = widget
@@ -149,6 +121,31 @@ class CollapsibleGroupBox(QWidget):
         else:
             self.content_container.setMaximumHeight(0)
 
+    def set_content_factory(self, factory: Callable[[], QWidget]):
+        """
+        Defer the content widget to a zero-argument factory.
+
+        The factory is only called the first time the group is expanded
+        (or ensure_content() is called), so sections that are never opened
+        never build their widgets.
+        """
+        self._factory = factory
+        if self._is_expanded:
+            self.ensure_content()
+
+    def ensure_content(self) -> Optional[QWidget]:
+        """
+        Build deferred content now if needed and return the content widget.
+
+        The factory is kept until it succeeds, so a failed build raises
+        again on the next call instead of leaving the group empty.
+        """
+        if self._factory is not None:
+            content = self._factory()
+            self._factory = None
+            self.set_content_widget(content)
+        return self._content_widget
+
     def _on_header_clicked(self, event):
         """Handle header click to toggle collapse state."""
         self._toggle()
@@ -170,6 +167,9 @@ class CollapsibleGroupBox(QWidget):
         except Exception:
             pass
 
+        if self._is_expanded:
+            self.ensure_content()
+
         # Calculate target heights based on current content size
         current_height = self.content_container.height()
         content_height = self.content_layout.sizeHint().height() + 20
@@ -189,10 +189,6 @@ class CollapsibleGroupBox(QWidget):
 
         self.toggled.emit(self._is_expanded)
 
-    def refresh_theme(self):
-        """Re-apply theme colors (called on theme toggle)."""
-        self._apply_theme_styles()
-
     def _on_expand_finished(self):
         """Called when expand animation finishes."""
         self.content_container.setMaximumHeight(16777215)
@@ -396,11 +392,7 @@ class VShaleParamsGroup(QWidget):
 
         # Info label for auto mode
         self.auto_info = QLabel("📈 GRmin/GRmax from P5/P95")
-        from themes.colors import get_color
-
-        self.auto_info.setStyleSheet(
-            f"color: {get_color('text_secondary')}; background-color: transparent;"
-        )
+        self.auto_info.setObjectName("hintLabel")
         layout.addWidget(self.auto_info)
 
         # VShale methods
@@ -770,10 +762,14 @@ class ShaleParamsGroup(QWidget):
         }
 
     def set_params(self, rho: float, dt: float, nphi: float):
-        """Set parameter values."""
-        self.rho_shale_spin.setValue(rho)
-        self.dt_shale_spin.setValue(dt)
-        self.nphi_shale_spin.setValue(nphi)
+        """Set parameter values, emitting params_changed once."""
+        with QSignalBlocker(self.rho_shale_spin), QSignalBlocker(
+            self.dt_shale_spin
+        ), QSignalBlocker(self.nphi_shale_spin):
+            self.rho_shale_spin.setValue(rho)
+            self.dt_shale_spin.setValue(dt)
+            self.nphi_shale_spin.setValue(nphi)
+        self.params_changed.emit()
 
 
 class ArchieParamsGroup(QWidget):
@@ -798,11 +794,7 @@ class ArchieParamsGroup(QWidget):
 
         # Preset info
         self.preset_info = QLabel("a=0.62, m=2.15, n=2.0")
-        from themes.colors import get_color
-
-        self.preset_info.setStyleSheet(
-            f"color: {get_color('text_secondary')}; background-color: transparent;"
-        )
+        self.preset_info.setObjectName("hintLabel")
         layout.addWidget(self.preset_info)
 
         # Custom input frame
@@ -936,8 +928,10 @@ class ResistivityParamsGroup(QWidget):
     def apply_calculated(self):
         """Apply calculated values to spinboxes."""
         if hasattr(self, "_calculated_rw"):
-            self.rw_spin.setValue(self._calculated_rw)
-            self.rsh_spin.setValue(self._calculated_rsh)
+            with QSignalBlocker(self.rw_spin), QSignalBlocker(self.rsh_spin):
+                self.rw_spin.setValue(self._calculated_rw)
+                self.rsh_spin.setValue(self._calculated_rsh)
+            self.params_changed.emit()
             self.result_label.setText("")
             self.apply_btn.setVisible(False)
 
@@ -962,11 +956,7 @@ class PermParamsGroup(QWidget):
 
         # Formula label
         formula = QLabel("Wyllie-Rose: K = C × φ^P / Swi^Q")
-        from themes.colors import get_color
-
-        formula.setStyleSheet(
-            f"color: {get_color('text_secondary')}; background-color: transparent; font-style: italic;"
-        )
+        formula.setObjectName("noteLabel")
         layout.addWidget(formula)
 
         form = QFormLayout()
@@ -996,11 +986,7 @@ class PermParamsGroup(QWidget):
 
         # Info label
         info = QLabel("💡 Timur defaults: C=8581, P=4.4, Q=2.0")
-        from themes.colors import get_color
-
-        info.setStyleSheet(
-            f"color: {get_color('text_secondary')}; background-color: transparent;"
-        )
+        info.setObjectName("hintLabel")
         layout.addWidget(info)
 
         # Calculate button
@@ -1040,9 +1026,13 @@ class PermParamsGroup(QWidget):
     def apply_calculated(self):
         """Apply calculated values to spinboxes."""
         if hasattr(self, "_calculated_C"):
-            self.c_spin.setValue(self._calculated_C)
-            self.p_spin.setValue(self._calculated_P)
-            self.q_spin.setValue(self._calculated_Q)
+            with QSignalBlocker(self.c_spin), QSignalBlocker(
+                self.p_spin
+            ), QSignalBlocker(self.q_spin):
+                self.c_spin.setValue(self._calculated_C)
+                self.p_spin.setValue(self._calculated_P)
+                self.q_spin.setValue(self._calculated_Q)
+            self.params_changed.emit()
             self.result_label.setText("✅ Values applied")
             self.apply_btn.setVisible(False)
 
@@ -1100,19 +1090,13 @@ class SwirEstimationGroup(QWidget):
         buckles_layout.addRow("K_buckles:", self.k_buckles_spin)
 
         self.buckles_info = QLabel("K_buckles = 0.02")
-        from themes.colors import get_color
-
-        self.buckles_info.setStyleSheet(
-            f"color: {get_color('text_secondary')}; background-color: transparent;"
-        )
+        self.buckles_info.setObjectName("hintLabel")
         buckles_layout.addRow("", self.buckles_info)
 
         layout.addWidget(self.buckles_frame)
 
         # Method info
         self.method_info = QLabel("✓ Best for no-core calibration")
-        from themes.colors import get_color
-
         self.method_info.setStyleSheet(f"color: {get_color('success_text')};")
         layout.addWidget(self.method_info)
 
@@ -1262,11 +1246,7 @@ class GasCorrectionGroup(QWidget):
 
         # Info label
         info_label = QLabel("⛽ Corrects N-D crossover in gas zones")
-        from themes.colors import get_color
-
-        info_label.setStyleSheet(
-            f"color: {get_color('text_secondary')}; font-style: italic; background-color: transparent;"
-        )
+        info_label.setObjectName("noteLabel")
         params_layout.addRow(info_label)
 
         # Neutron factor
@@ -1526,8 +1506,6 @@ class PorosityMethodGroup(QWidget):
 
         # Info label
         self.info_label = QLabel("Used for Sw, Perm, HCPV calculations")
-        from themes.colors import get_color
-
         self.info_label.setStyleSheet(
             f"color: {get_color('text_tertiary')}; font-size: 11px;"
         )